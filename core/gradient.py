@@ -12,6 +12,7 @@ Key changes:
 import copy
 import hashlib
 import time
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from .color_utils import blend_colors
 from .gradient_metadata import GradientMetadata
@@ -146,6 +147,31 @@ class Gradient:
         blend_factor = (position - before[0]) / (after[0] - before[0])
         return blend_colors(before[1], after[1], blend_factor)
     
+    def _interpolate_array_from_stops(self, positions: np.ndarray,
+                                      stops: List[Tuple[float, Tuple[int, int, int]]]) -> np.ndarray:
+        """Vectorized _interpolate_from_stops for an array of positions (2+ stops)."""
+        stop_pos = np.array([stop_pos for stop_pos, _ in stops], dtype=np.float64)
+        stop_colors = np.array([stop_color for _, stop_color in stops], dtype=np.float64)
+        
+        x = positions[:, None]
+        below = stop_pos <= x
+        above = stop_pos >= x
+        before_pos = np.where(below, stop_pos, -np.inf).max(axis=1)
+        after_pos = np.where(above, stop_pos, np.inf).min(axis=1)
+        
+        # Bracketing stops; ties go to the first stop in list order, like the scalar loop
+        before_color = stop_colors[np.argmax(below & (stop_pos == before_pos[:, None]), axis=1)]
+        after_color = stop_colors[np.argmax(above & (stop_pos == after_pos[:, None]), axis=1)]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            blend_factor = ((positions - before_pos) / (after_pos - before_pos))[:, None]
+            colors = np.trunc(before_color * (1 - blend_factor) + after_color * blend_factor)
+        
+        colors = np.where((before_pos == after_pos)[:, None], before_color, colors)
+        colors = np.where(above.any(axis=1)[:, None], colors, stop_colors[-1])
+        colors = np.where(below.any(axis=1)[:, None], colors, stop_colors[0])
+        return colors.astype(np.int64)
+    
     def apply_seamless_permanently(self):
         """Permanently apply seamless blending by modifying the actual color stops."""
         if not self._seamless.enabled or len(self._color_stops) < 2:
@@ -235,6 +261,11 @@ class Gradient:
         # NO SORTING - maintains order as added
         return True
     
+    def set_color_stops(self, stops: List[Tuple[float, Tuple[int, int, int]]]):
+        """Replace all color stops in one step - keeps the given order, capped at MAX_COLOR_STOPS."""
+        self._color_stops = [ColorStop(position, color)
+                             for position, color in stops[:self.MAX_COLOR_STOPS]]
+    
     def remove_color_stop_at_index(self, index: int):
         """Remove color stop by index."""
         if 0 <= index < len(self._color_stops) and len(self._color_stops) > 1:
@@ -271,6 +302,22 @@ class Gradient:
         return [self.get_interpolated_color(i / (num_samples - 1)) 
                 for i in range(num_samples)]
     
+    def get_sample_array(self, num_samples: int = 256) -> np.ndarray:
+        """Get the same colors as get_sample_colors as a (num_samples, 3) integer array."""
+        if not self._color_stops:
+            return np.full((num_samples, 3), 128, dtype=np.int64)
+        
+        if len(self._color_stops) == 1:
+            return np.tile(np.array(self._color_stops[0].color, dtype=np.int64), (num_samples, 1))
+        
+        if self._seamless.enabled:
+            effective_stops = self._get_seamless_stops()
+        else:
+            effective_stops = [(stop.position, stop.color) for stop in self._color_stops]
+        
+        positions = np.arange(num_samples) / (num_samples - 1)
+        return self._interpolate_array_from_stops(positions, effective_stops)
+    
     def get_sample_colors_for_preview(self, num_samples: int = 256) -> List[Tuple[int, int, int]]:
         """Get evenly sampled colors for preview (with progressive blending if enabled)."""
         return [self.get_interpolated_color_for_preview(i / (num_samples - 1)) 
@@ -10,8 +10,12 @@ import os
 import xml.dom.minidom as minidom
 import xml.etree.ElementTree as ET
 import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple, Optional
 
+# Batch MAP writes are mostly small file I/O, so use more threads than cores
+MAP_EXPORT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def save_map_format(gradient, file_path):
     """
@@ -28,20 +32,14 @@ def save_map_format(gradient, file_path):
         True if save was successful, False otherwise
     """
     try:
+        # Generate 256 color entries by sampling the gradient, formatted as
+        # one payload so the file is written with a single call
+        num_samples = 256
+        samples = gradient.get_sample_array(num_samples)
+        payload = ("%3d %3d %3d\n" * num_samples) % tuple(samples.ravel().tolist())
+        
         with open(file_path, 'w') as f:
-            # Get color stops and sort by position
-            color_stops = gradient.get_color_stops()
-            color_stops.sort(key=lambda x: x[0])
-            
-            # Generate 256 color entries by sampling the gradient
-            num_samples = 256
-            for i in range(num_samples):
-                position = i / (num_samples - 1)
-                color = gradient.get_interpolated_color(position)
-                r, g, b = color
-                
-                # Write RGB values separated by spaces
-                f.write(f"{r:3d} {g:3d} {b:3d}\n")
+            f.write(payload)
         
         return True
     
@@ -51,7 +49,7 @@ def save_map_format(gradient, file_path):
 
 
 def export_multiple_maps_batch(gradients_data, output_directory, base_name="gradient", 
-                              start_number=1, zero_padding=2):
+                              start_number=1, zero_padding=2, progress_callback=None):
     """
     Export multiple gradients as sequential MAP files.
     
@@ -61,6 +59,7 @@ def export_multiple_maps_batch(gradients_data, output_directory, base_name="grad
         base_name: Base name for the files (default: "gradient")
         start_number: Starting number for the sequence (default: 1)
         zero_padding: Number of digits for zero-padding (default: 2, gives 01, 02, etc.)
+        progress_callback: Optional callable(done, total, file_name) called after each file
         
     Returns:
         Tuple (success_count, total_count, failed_files_list)
@@ -81,37 +80,65 @@ def export_multiple_maps_batch(gradients_data, output_directory, base_name="grad
                 # List of gradient objects
                 gradients = gradients_data
         
-        success_count = 0
-        failed_files = []
-        total_count = len(gradients)
-        
+        # Generate filenames with zero-padding
+        planned = []
         for i, gradient in enumerate(gradients):
-            try:
-                # Generate filename with zero-padding
-                file_number = start_number + i
-                file_name = f"{base_name}_{file_number:0{zero_padding}d}.map"
-                file_path = os.path.join(output_directory, file_name)
-                
-                # Save the MAP file
-                if save_map_format(gradient, file_path):
-                    success_count += 1
-                    print(f"Exported: {file_name}")
-                else:
-                    failed_files.append(file_name)
-                    print(f"Failed to export: {file_name}")
-                    
-            except Exception as e:
-                file_name = f"{base_name}_{start_number + i:0{zero_padding}d}.map"
-                failed_files.append(file_name)
-                print(f"Error exporting {file_name}: {e}")
+            file_name = f"{base_name}_{start_number + i:0{zero_padding}d}.map"
+            planned.append((gradient, os.path.join(output_directory, file_name)))
         
-        return success_count, total_count, failed_files
+        success_count, failed_files = _save_maps_concurrently(planned, progress_callback)
+        return success_count, len(gradients), failed_files
         
     except Exception as e:
         print(f"Error in batch MAP export: {e}")
         return 0, len(gradients_data) if gradients_data else 0, []
 
 
+def _save_maps_concurrently(planned, progress_callback=None, total_count=None, done_count=0):
+    """
+    Write MAP files for (gradient, file_path) pairs on a thread pool.
+    
+    Args:
+        planned: List of (gradient, file_path) tuples
+        progress_callback: Optional callable(done, total, file_name) called after each file
+        total_count: Total reported to progress_callback (default: len(planned))
+        done_count: Files already accounted for before these writes
+        
+    Returns:
+        Tuple (success_count, failed_files_list)
+    """
+    if total_count is None:
+        total_count = len(planned)
+    
+    success_count = 0
+    failed_files = []
+    
+    with ThreadPoolExecutor(max_workers=MAP_EXPORT_WORKERS) as executor:
+        futures = {executor.submit(save_map_format, gradient, file_path): file_path
+                   for gradient, file_path in planned}
+        
+        for future in as_completed(futures):
+            file_name = os.path.basename(futures[future])
+            try:
+                saved = future.result()
+            except Exception as e:
+                saved = False
+                print(f"Error exporting {file_name}: {e}")
+            
+            if saved:
+                success_count += 1
+                print(f"Exported: {file_name}")
+            else:
+                failed_files.append(file_name)
+                print(f"Failed to export: {file_name}")
+            
+            done_count += 1
+            if progress_callback is not None:
+                progress_callback(done_count, total_count, file_name)
+    
+    return success_count, failed_files
+
+
 def export_gradient_list_as_maps(gradient_list_panel, output_directory, base_name="gradient"):
     """
     Export all gradients from a gradient list panel as sequential MAP files.
@@ -134,13 +161,14 @@ def export_gradient_list_as_maps(gradient_list_panel, output_directory, base_nam
     )
 
 
-def export_maps_with_custom_names(gradients_with_names, output_directory):
+def export_maps_with_custom_names(gradients_with_names, output_directory, progress_callback=None):
     """
     Export gradients as MAP files using their custom names.
     
     Args:
         gradients_with_names: List of (gradient, custom_name) tuples
         output_directory: Directory where MAP files will be saved
+        progress_callback: Optional callable(done, total, file_name) called after each file
         
     Returns:
         Tuple (success_count, total_count, failed_files_list)
@@ -149,9 +177,9 @@ def export_maps_with_custom_names(gradients_with_names, output_directory):
         # Ensure output directory exists
         os.makedirs(output_directory, exist_ok=True)
         
-        success_count = 0
+        planned = []
+        planned_paths = set()
         failed_files = []
-        total_count = len(gradients_with_names)
         
         for gradient, custom_name in gradients_with_names:
             try:
@@ -165,28 +193,28 @@ def export_maps_with_custom_names(gradients_with_names, output_directory):
                 file_name = f"{safe_name}.map"
                 file_path = os.path.join(output_directory, file_name)
                 
-                # Handle duplicate filenames by adding a number
+                # Handle duplicate filenames, including ones planned earlier
+                # in this batch, by adding a number
                 counter = 1
                 original_file_path = file_path
-                while os.path.exists(file_path):
+                while file_path in planned_paths or os.path.exists(file_path):
                     name_part, ext = os.path.splitext(original_file_path)
                     file_path = f"{name_part}_{counter}{ext}"
                     counter += 1
                 
-                # Save the MAP file
-                if save_map_format(gradient, file_path):
-                    success_count += 1
-                    print(f"Exported: {os.path.basename(file_path)}")
-                else:
-                    failed_files.append(os.path.basename(file_path))
-                    print(f"Failed to export: {os.path.basename(file_path)}")
-                    
+                planned_paths.add(file_path)
+                planned.append((gradient, file_path))
+                
             except Exception as e:
                 file_name = f"{custom_name}.map"
                 failed_files.append(file_name)
                 print(f"Error exporting {file_name}: {e}")
         
-        return success_count, total_count, failed_files
+        success_count, write_failures = _save_maps_concurrently(
+            planned, progress_callback, len(gradients_with_names), len(failed_files))
+        failed_files.extend(write_failures)
+        
+        return success_count, len(gradients_with_names), failed_files
         
     except Exception as e:
         print(f"Error in custom names MAP export: {e}")
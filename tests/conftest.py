@@ -0,0 +1,15 @@
+"""Shared fixtures for the gradient generator tests."""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Return the QApplication shared by all widget tests."""
+    app = QApplication.instance() or QApplication([])
+    yield app
@@ -0,0 +1,39 @@
+"""Tests for batch gradient generation."""
+import numpy as np
+import pytest
+
+from ..core.gradient import Gradient
+from ..ui import batch_operations
+from ..ui.batch_operations import BatchGenerationThread
+
+
+@pytest.mark.parametrize("operation", ["Complementary", "Triadic", "Analogous", "Hue Rotation"])
+def test_progress_reaches_100_for_fixed_size_operations(qapp, operation):
+    thread = BatchGenerationThread(Gradient(), operation, 50, {})
+    progress = []
+    thread.progress.connect(progress.append)
+    
+    thread.run()
+    
+    assert progress[-1] == 100
+    assert progress == sorted(progress)
+
+
+@pytest.mark.parametrize("dh, ds_mul, dv_mul", [
+    (0.0, 1.0, 1.0),
+    (120.0, 1.0, 1.0),
+    (np.linspace(0.0, 360.0, 37), 1.0, 1.0),
+    (np.array([-30.0, 0.0, 30.0]), 1.0, 1.0),
+    (0.0, np.linspace(0.5, 1.5, 11), 1.0),
+    (0.0, 1.0, np.linspace(0.5, 1.5, 11)),
+    (-30.0, 1.3, 0.7),
+])
+def test_hsv_kernel_matches_numpy(dh, ds_mul, dv_mul):
+    pytest.importorskip("numba")
+    kernel = batch_operations._get_hsv_kernel()
+    rgb = np.random.default_rng(0).integers(0, 256, (5000, 3), dtype=np.uint8)
+    
+    jit_result = batch_operations._apply_hsv_jit(kernel, rgb, dh, ds_mul, dv_mul)
+    numpy_result = batch_operations._apply_hsv_numpy(rgb, dh, ds_mul, dv_mul)
+    
+    np.testing.assert_array_equal(jit_result, numpy_result)
@@ -0,0 +1,47 @@
+"""Tests for the color stops editor."""
+from ..core.color_utils import rgb_to_hex
+from ..core.gradient import Gradient
+from ..ui.controls.color_stops import ColorStopsEditor
+
+
+def test_color_edit_then_model_revert_refreshes_row(qapp):
+    gradient = Gradient()
+    editor = ColorStopsEditor(gradient)
+    row = editor.color_stops[0]
+    original = gradient.get_color_stops()[0][1]
+    
+    row.hex_edit.setText("#010203")
+    row.on_hex_edited()
+    assert gradient.get_color_stops()[0][1] == (1, 2, 3)
+    
+    gradient.set_color_at_index(0, original)
+    editor.update_from_model()
+    
+    assert tuple(row.color) == original
+    assert row.hex_edit.text() == rgb_to_hex(*original)
+
+
+def _wait_for_generation(editor, qapp):
+    editor._generation_thread.wait()
+    qapp.processEvents()
+
+
+def test_regenerate_with_same_seed_uses_generation_thread(qapp):
+    gradient = Gradient()
+    editor = ColorStopsEditor(gradient)
+    replaced = []
+    editor.stops_replaced.connect(lambda: replaced.append(True))
+    
+    editor.generate_random_gradient()
+    _wait_for_generation(editor, qapp)
+    first_stops = gradient.get_color_stops()
+    first_thread = editor._generation_thread
+    
+    gradient.set_color_stops([(0.0, (0, 0, 0)), (1.0, (255, 255, 255))])
+    editor.regenerate_with_same_seed()
+    assert editor._generation_thread is not first_thread
+    _wait_for_generation(editor, qapp)
+    
+    assert gradient.get_color_stops() == first_stops
+    assert len(replaced) == 2
+    assert editor.status_label.text() == "Regenerated with same pattern"
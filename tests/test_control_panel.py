@@ -0,0 +1,21 @@
+"""Tests for the control panel's optional tabs."""
+from ..core.gradient import Gradient
+from ..ui.controls import control_panel
+
+
+def _tab_names(panel):
+    return [panel.tabs.tabText(i) for i in range(panel.tabs.count())]
+
+
+def test_failed_optional_import_keeps_placeholder_tabs(qapp, monkeypatch):
+    def failing_import(modname, attr):
+        raise ImportError(modname)
+    
+    monkeypatch.setattr(control_panel, '_cached_import', failing_import)
+    panel = control_panel.ControlPanel(Gradient())
+    names = _tab_names(panel)
+    
+    assert "Themes" in names
+    assert "Blend" in names
+    assert not hasattr(panel, 'theme_generator_widget')
+    assert not hasattr(panel, 'blending_widget')
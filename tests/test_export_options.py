@@ -0,0 +1,55 @@
+"""Tests for the export options widget."""
+import threading
+
+from PyQt5.QtWidgets import QMainWindow
+
+from ..core.gradient import Gradient
+from ..ui.controls import export_options
+
+
+class _GradientList:
+    def __init__(self, gradients):
+        self.gradients = gradients
+
+
+class _SummaryDialog:
+    def __init__(self, summary, parent=None):
+        self.summary = summary
+    
+    def exec_(self):
+        return 0
+
+
+def test_showing_widget_mid_export_keeps_batch_buttons_disabled(qapp, monkeypatch, tmp_path):
+    release = threading.Event()
+    
+    def blocking_export(gradients, output_directory, *args, progress_callback=None):
+        release.wait(5)
+        return len(gradients), len(gradients), []
+    
+    monkeypatch.setattr(export_options, 'export_multiple_maps_batch', blocking_export)
+    monkeypatch.setattr(export_options, 'ExportSummaryDialog', _SummaryDialog)
+    
+    window = QMainWindow()
+    window.gradient_list_panel = _GradientList([Gradient()])
+    widget = export_options.ExportOptionsWidget(Gradient())
+    window.setCentralWidget(widget)
+    window.show()
+    widget.tabs.setCurrentIndex(1)  # Build the batch tab
+    
+    settings = {'export_mode': 'sequential', 'output_directory': str(tmp_path),
+                'base_name': "gradient", 'start_number': 1, 'zero_padding': 2}
+    widget._execute_batch_export(window.gradient_list_panel.gradients, settings)
+    
+    try:
+        widget.hide()
+        widget.show()
+        assert not widget.batch_export_list_button.isEnabled()
+        assert not widget.batch_export_custom_button.isEnabled()
+    finally:
+        release.set()
+        widget.export_thread.wait()
+    
+    qapp.processEvents()
+    assert widget.batch_export_list_button.isEnabled()
+    assert widget.batch_export_custom_button.isEnabled()
@@ -258,6 +258,7 @@ class GradientHistoryManager(QObject):
         """Enable or disable history tracking."""
         self.is_enabled = enabled
         self._emit_availability_signals()
+        self.history_changed.emit()
     
     def get_current_state_description(self) -> str:
         """Get description of current state."""
@@ -5,9 +5,27 @@ Undo/Redo Integration Module
 This module integrates the undo/redo functionality with the main application,
 connecting the history manager, UI widgets, and animated preview.
 """
+import sys
+import weakref
+from functools import partial
+
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 
+# Weak reference to the application's main window, set at construction time
+_main_window_ref = None
+
+
+def register_main_window(main_window):
+    """
+    Register the main window so auto-integration can find it directly.
+    
+    Args:
+        main_window: Main application window instance
+    """
+    global _main_window_ref
+    _main_window_ref = weakref.ref(main_window)
+
 
 def integrate_undo_redo_system(main_window):
     """
@@ -19,69 +37,57 @@ def integrate_undo_redo_system(main_window):
     Returns:
         True if integration was successful, False otherwise
     """
+    # Check if animated preview exists and has history manager
+    if not hasattr(main_window, 'animated_preview'):
+        print("No animated preview found for undo/redo integration")
+        return False
+    
+    animated_preview = main_window.animated_preview
+    
+    if not hasattr(animated_preview, 'history_manager'):
+        print("Animated preview does not have history manager")
+        return False
+    
+    # Check if undo/redo widget exists
+    if not hasattr(main_window, 'undo_redo_widget'):
+        print("No undo/redo widget found")
+        return False
+    
+    undo_redo_widget = main_window.undo_redo_widget
+    history_manager = animated_preview.history_manager
+    
     try:
-        # Check if animated preview exists and has history manager
-        if not hasattr(main_window, 'animated_preview'):
-            print("No animated preview found for undo/redo integration")
-            return False
-        
-        animated_preview = main_window.animated_preview
-        
-        if not hasattr(animated_preview, 'history_manager'):
-            print("Animated preview does not have history manager")
-            return False
-        
-        # Check if undo/redo widget exists
-        if not hasattr(main_window, 'undo_redo_widget'):
-            print("No undo/redo widget found")
-            return False
-        
-        undo_redo_widget = main_window.undo_redo_widget
-        history_manager = animated_preview.history_manager
-        
-        # Connect history manager signals to undo/redo widget
-        history_manager.undo_available.connect(
-            lambda available: undo_redo_widget.update_button_states(
-                available, undo_redo_widget.redo_available
-            )
-        )
-        
-        history_manager.redo_available.connect(
-            lambda available: undo_redo_widget.update_button_states(
-                undo_redo_widget.undo_available, available
-            )
-        )
-        
+        # history_changed drives the whole widget refresh; the per-flag
+        # availability signals would only repeat the same work
         history_manager.history_changed.connect(
-            lambda: _update_undo_redo_state(undo_redo_widget, history_manager)
+            partial(_update_undo_redo_state, undo_redo_widget, history_manager)
         )
         
         # Connect undo/redo widget signals to animated preview
         undo_redo_widget.undo_requested.connect(animated_preview.undo)
         undo_redo_widget.redo_requested.connect(animated_preview.redo)
-        
-        # Set up periodic state updates
-        def update_state():
-            if not main_window._is_destroyed if hasattr(main_window, '_is_destroyed') else False:
-                _update_undo_redo_state(undo_redo_widget, history_manager)
-        
-        # Update state every few seconds
-        state_timer = QTimer(main_window)
-        state_timer.timeout.connect(update_state)
-        state_timer.start(2000)  # Update every 2 seconds
-        
-        # Store timer reference to prevent garbage collection
-        main_window._undo_redo_timer = state_timer
-        
-        # Initial state update
-        QTimer.singleShot(1000, update_state)
-        
-        print("Undo/redo system integrated successfully")
-        return True
-        
-    except Exception as e:
+    except (RuntimeError, TypeError) as e:
         print(f"Error integrating undo/redo system: {e}")
         return False
+    
+    # Set up periodic state updates
+    def update_state():
+        if not main_window._is_destroyed if hasattr(main_window, '_is_destroyed') else False:
+            _update_undo_redo_state(undo_redo_widget, history_manager)
+    
+    # Update state every few seconds
+    state_timer = QTimer(main_window)
+    state_timer.timeout.connect(update_state)
+    state_timer.start(2000)  # Update every 2 seconds
+    
+    # Store timer reference to prevent garbage collection
+    main_window._undo_redo_timer = state_timer
+    
+    # Initial state update
+    QTimer.singleShot(1000, update_state)
+    
+    print("Undo/redo system integrated successfully")
+    return True
 
 
 def _update_undo_redo_state(undo_redo_widget, history_manager):
@@ -100,10 +106,40 @@ def _update_undo_redo_state(undo_redo_widget, history_manager):
         undo_redo_widget.update_button_states(can_undo, can_redo)
         undo_redo_widget.set_current_description(current_desc)
         
-    except Exception as e:
+    except (RuntimeError, AttributeError) as e:
+        # Raised when the underlying Qt objects have already been deleted
         print(f"Error updating undo/redo state: {e}")
 
 
+class _SaveDebouncer:
+    """Coalesces rapid gradient updates into a single history save."""
+    
+    DELAY_MS = 200
+    
+    def __init__(self, main_window, history_manager):
+        """
+        Create the save timer once, bound to the main window's gradient.
+        
+        Args:
+            main_window: Main application window instance
+            history_manager: The gradient history manager
+        """
+        self.main_window = main_window
+        self.history_manager = history_manager
+        
+        self.timer = QTimer(main_window)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._save)
+    
+    def schedule(self):
+        """Restart the save delay."""
+        self.timer.start(self.DELAY_MS)
+    
+    def _save(self):
+        """Save the current gradient to history."""
+        self.history_manager.save_state(self.main_window.current_gradient)
+
+
 def setup_undo_redo_for_main_window(main_window):
     """
     Set up undo/redo functionality for the main window.
@@ -112,15 +148,11 @@ def setup_undo_redo_for_main_window(main_window):
     Args:
         main_window: Main application window instance
     """
-    try:
-        # Delay integration to ensure everything is properly initialized
-        def delayed_integration():
-            return integrate_undo_redo_system(main_window)
-        
-        QTimer.singleShot(2000, delayed_integration)
-        
-    except Exception as e:
-        print(f"Error setting up undo/redo system: {e}")
+    # Delay integration to ensure everything is properly initialized
+    def delayed_integration():
+        return integrate_undo_redo_system(main_window)
+    
+    QTimer.singleShot(2000, delayed_integration)
 
 
 def connect_gradient_updates_to_history(main_window):
@@ -130,34 +162,23 @@ def connect_gradient_updates_to_history(main_window):
     Args:
         main_window: Main application window instance
     """
-    try:
-        if (hasattr(main_window, 'control_panel') and 
-            hasattr(main_window, 'animated_preview') and
-            hasattr(main_window.animated_preview, 'history_manager')):
-            
-            control_panel = main_window.control_panel
-            history_manager = main_window.animated_preview.history_manager
+    if (hasattr(main_window, 'control_panel') and 
+        hasattr(main_window, 'animated_preview') and
+        hasattr(main_window.animated_preview, 'history_manager')):
+        
+        control_panel = main_window.control_panel
+        history_manager = main_window.animated_preview.history_manager
+        
+        # Connect control panel updates to history saving
+        if hasattr(control_panel, 'gradient_updated'):
+            # Save with a small delay to batch rapid updates
+            # Keep the debouncer itself alive; its bound-method slots are only weakly held
+            debouncer = _SaveDebouncer(main_window, history_manager)
+            main_window._history_save_debouncer = debouncer
+            main_window._history_save_timer = debouncer.timer
             
-            # Connect control panel updates to history saving
-            if hasattr(control_panel, 'gradient_updated'):
-                def save_on_update():
-                    # Save with a small delay to batch rapid updates
-                    if hasattr(main_window, '_history_save_timer'):
-                        main_window._history_save_timer.stop()
-                    else:
-                        main_window._history_save_timer = QTimer()
-                        main_window._history_save_timer.setSingleShot(True)
-                        main_window._history_save_timer.timeout.connect(
-                            lambda: history_manager.save_state(main_window.current_gradient)
-                        )
-                    
-                    main_window._history_save_timer.start(200)  # 200ms delay
-                
-                control_panel.gradient_updated.connect(save_on_update)
-                print("Connected gradient updates to history saving")
-        
-    except Exception as e:
-        print(f"Error connecting gradient updates to history: {e}")
+            control_panel.gradient_updated.connect(debouncer.schedule)
+            print("Connected gradient updates to history saving")
 
 
 def get_undo_redo_status(main_window) -> dict:
@@ -209,12 +230,15 @@ def auto_integrate_undo_redo():
         if not app:
             return False
         
-        # Find main window
-        main_window = None
-        for widget in app.topLevelWidgets():
-            if widget.__class__.__name__ == 'MainWindow':
-                main_window = widget
-                break
+        # Find main window, preferring the registered reference
+        if _main_window_ref is not None:
+            main_window = _main_window_ref()
+        else:
+            main_window = None
+            for widget in app.topLevelWidgets():
+                if widget.__class__.__name__ == 'MainWindow':
+                    main_window = widget
+                    break
         
         if main_window:
             # Set up undo/redo with proper timing
@@ -249,6 +273,9 @@ def cleanup_undo_redo_system(main_window):
             main_window._history_save_timer.stop()
             delattr(main_window, '_history_save_timer')
         
+        if hasattr(main_window, '_history_save_debouncer'):
+            delattr(main_window, '_history_save_debouncer')
+        
         # Clear history
         if (hasattr(main_window, 'animated_preview') and 
             hasattr(main_window.animated_preview, 'history_manager')):
@@ -268,17 +295,17 @@ def test_undo_redo_system(main_window):
     Args:
         main_window: Main application window instance
     """
+    # Report lines are collected and written in a single call
+    lines = ["Testing undo/redo system..."]
     try:
-        print("Testing undo/redo system...")
-        
         # Get status
         status = get_undo_redo_status(main_window)
-        print(f"System status: {status}")
+        lines.append(f"System status: {status}")
         
         if not status.get("integrated"):
-            print("System not integrated - attempting integration...")
+            lines.append("System not integrated - attempting integration...")
             success = integrate_undo_redo_system(main_window)
-            print(f"Integration result: {success}")
+            lines.append(f"Integration result: {success}")
             return success
         
         # Test history manager
@@ -288,25 +315,28 @@ def test_undo_redo_system(main_window):
             history_manager = main_window.animated_preview.history_manager
             gradient_model = main_window.current_gradient
             
-            print(f"History size: {len(history_manager.history)}")
-            print(f"Current index: {history_manager.current_index}")
-            print(f"Can undo: {history_manager.can_undo()}")
-            print(f"Can redo: {history_manager.can_redo()}")
+            lines.append(f"History size: {len(history_manager.history)}")
+            lines.append(f"Current index: {history_manager.current_index}")
+            lines.append(f"Can undo: {history_manager.can_undo()}")
+            lines.append(f"Can redo: {history_manager.can_redo()}")
             
             # Test saving a state
-            print("Testing state save...")
+            lines.append("Testing state save...")
             history_manager.save_state(gradient_model, force=True, description="Test state")
             
-            print(f"After save - History size: {len(history_manager.history)}")
-            print(f"Can undo: {history_manager.can_undo()}")
+            lines.append(f"After save - History size: {len(history_manager.history)}")
+            lines.append(f"Can undo: {history_manager.can_undo()}")
             
             return True
         
         return False
         
     except Exception as e:
-        print(f"Error testing undo/redo system: {e}")
+        lines.append(f"Error testing undo/redo system: {e}")
         return False
+    
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def debug_undo_redo_state(main_window):
@@ -316,43 +346,52 @@ def debug_undo_redo_state(main_window):
     Args:
         main_window: Main application window instance
     """
+    # Report lines are collected and written in a single call
+    lines = ["=== Undo/Redo Debug Information ==="]
     try:
-        print("=== Undo/Redo Debug Information ===")
-        
         # Check main window components
-        print(f"Has animated_preview: {hasattr(main_window, 'animated_preview')}")
-        print(f"Has undo_redo_widget: {hasattr(main_window, 'undo_redo_widget')}")
-        print(f"Has current_gradient: {hasattr(main_window, 'current_gradient')}")
+        lines.append(f"Has animated_preview: {hasattr(main_window, 'animated_preview')}")
+        lines.append(f"Has undo_redo_widget: {hasattr(main_window, 'undo_redo_widget')}")
+        lines.append(f"Has current_gradient: {hasattr(main_window, 'current_gradient')}")
         
         if hasattr(main_window, 'animated_preview'):
             preview = main_window.animated_preview
-            print(f"Preview has history_manager: {hasattr(preview, 'history_manager')}")
+            lines.append(f"Preview has history_manager: {hasattr(preview, 'history_manager')}")
             
             if hasattr(preview, 'history_manager'):
                 hm = preview.history_manager
-                print(f"History manager info: {hm.get_history_info()}")
-                print(f"History states: {len(hm.history)}")
+                history = hm.history
+                history_size = len(history)
+                lines.append(f"History manager info: {hm.get_history_info()}")
+                lines.append(f"History states: {history_size}")
                 
                 # Print recent history states
-                if hm.history:
-                    print("Recent states:")
-                    for i, state in enumerate(hm.history[-5:]):  # Last 5 states
-                        marker = " <-- CURRENT" if i + len(hm.history) - 5 == hm.current_index else ""
-                        print(f"  {i + len(hm.history) - 5}: {state.description}{marker}")
+                if history_size:
+                    lines.append("Recent states:")
+                    recent = history[-5:]  # Last 5 states
+                    start = history_size - len(recent)
+                    current_index = hm.current_index
+                    for index, state in enumerate(recent, start):
+                        marker = " <-- CURRENT" if index == current_index else ""
+                        lines.append(f"  {index}: {state.description}{marker}")
         
         if hasattr(main_window, 'undo_redo_widget'):
             widget = main_window.undo_redo_widget
             state_info = widget.get_state_info()
-            print(f"Widget state: {state_info}")
+            lines.append(f"Widget state: {state_info}")
         
-        print("=== End Debug Information ===")
+        lines.append("=== End Debug Information ===")
         
     except Exception as e:
-        print(f"Error in debug function: {e}")
+        lines.append(f"Error in debug function: {e}")
+    
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # Export main integration function for easy import
 __all__ = [
+    'register_main_window',
     'integrate_undo_redo_system',
     'setup_undo_redo_for_main_window', 
     'connect_gradient_updates_to_history',
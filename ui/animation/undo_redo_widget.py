@@ -17,19 +17,26 @@ class UndoRedoWidget(QWidget):
     undo_requested = pyqtSignal()
     redo_requested = pyqtSignal()
     
+    # Show the detailed history tooltip after hovering for a second
+    ENABLE_DETAILED_TOOLTIP = False
+    
     def __init__(self, parent=None):
         """Initialize the undo/redo widget."""
         super().__init__(parent)
         
         # State tracking
-        self.undo_available = False
-        self.redo_available = False
+        # None until init_ui applies the initial state
+        self.undo_available = None
+        self.redo_available = None
         self.current_description = "No state"
+        self._compact_mode = True
+        
+        # Status label is hidden by default and built lazily
+        self.status_label = None
         
-        # Tooltip timer
-        self.tooltip_timer = QTimer()
-        self.tooltip_timer.setSingleShot(True)
-        self.tooltip_timer.timeout.connect(self._show_tooltip)
+        # Tooltip timer (created on first hover when detailed tooltips are enabled)
+        self.tooltip_timer = None
+        self._tooltip_shown = False
         
         self.init_ui()
     
@@ -47,17 +54,9 @@ class UndoRedoWidget(QWidget):
         self.undo_button.clicked.connect(self._on_undo_clicked)
         self.redo_button.clicked.connect(self._on_redo_clicked)
         
-        # Status label (optional, can be hidden)
-        self.status_label = QLabel()
-        self.status_label.setStyleSheet(
-            "color: #888; font-size: 9px; font-style: italic;"
-        )
-        self.status_label.setVisible(False)  # Hidden by default
-        
-        # Add widgets to layout
+        # Add widgets to layout (status label is created on first show)
         layout.addWidget(self.undo_button)
         layout.addWidget(self.redo_button)
-        layout.addWidget(self.status_label)
         layout.addStretch()
         
         # Set initial state
@@ -128,18 +127,16 @@ class UndoRedoWidget(QWidget):
             can_undo: Whether undo is available
             can_redo: Whether redo is available
         """
-        self.undo_available = can_undo
-        self.redo_available = can_redo
-        
-        self.undo_button.setEnabled(can_undo)
-        self.redo_button.setEnabled(can_redo)
-        
-        # Update tooltips with availability info
-        undo_tooltip = "Undo last change" if can_undo else "Nothing to undo"
-        redo_tooltip = "Redo last undone change" if can_redo else "Nothing to redo"
+        # Only touch the buttons whose availability actually changed
+        if can_undo != self.undo_available:
+            self.undo_button.setEnabled(can_undo)
+            self.undo_button.setToolTip("Undo last change" if can_undo else "Nothing to undo")
+            self.undo_available = can_undo
         
-        self.undo_button.setToolTip(undo_tooltip)
-        self.redo_button.setToolTip(redo_tooltip)
+        if can_redo != self.redo_available:
+            self.redo_button.setEnabled(can_redo)
+            self.redo_button.setToolTip("Redo last undone change" if can_redo else "Nothing to redo")
+            self.redo_available = can_redo
         
         # Update visual feedback
         self._update_visual_state()
@@ -152,7 +149,8 @@ class UndoRedoWidget(QWidget):
             description: Description of current state
         """
         self.current_description = description
-        self.status_label.setText(f"State: {description}")
+        if self.status_label is not None:
+            self.status_label.setText(f"State: {description}")
     
     def show_status_label(self, show: bool = True):
         """
@@ -161,6 +159,15 @@ class UndoRedoWidget(QWidget):
         Args:
             show: Whether to show the status label
         """
+        if self.status_label is None:
+            if not show:
+                return
+            self.status_label = QLabel(f"State: {self.current_description}")
+            self.status_label.setStyleSheet(
+                "color: #888; font-size: 9px; font-style: italic;"
+            )
+            self.layout().insertWidget(2, self.status_label)
+        
         self.status_label.setVisible(show)
     
     def _update_visual_state(self):
@@ -196,17 +203,29 @@ class UndoRedoWidget(QWidget):
             tooltip_text += f"Redo: {'Available' if self.redo_available else 'Not available'}"
             
             QToolTip.showText(QCursor.pos(), tooltip_text, self)
+            self._tooltip_shown = True
     
     def enterEvent(self, event):
         """Handle mouse enter for delayed tooltip."""
         super().enterEvent(event)
+        if not self.ENABLE_DETAILED_TOOLTIP:
+            return
+        
+        if self.tooltip_timer is None:
+            self.tooltip_timer = QTimer(self)
+            self.tooltip_timer.setSingleShot(True)
+            self.tooltip_timer.timeout.connect(self._show_tooltip)
+        
         self.tooltip_timer.start(1000)  # Show detailed tooltip after 1 second
     
     def leaveEvent(self, event):
         """Handle mouse leave."""
         super().leaveEvent(event)
-        self.tooltip_timer.stop()
-        QToolTip.hideText()
+        if self.tooltip_timer is not None:
+            self.tooltip_timer.stop()
+        if self._tooltip_shown:
+            QToolTip.hideText()
+            self._tooltip_shown = False
     
     def set_compact_mode(self, compact: bool = True):
         """
@@ -215,18 +234,31 @@ class UndoRedoWidget(QWidget):
         Args:
             compact: Whether to use compact mode
         """
-        if compact:
-            self.undo_button.setText("↶")
-            self.redo_button.setText("↷")
-            self.show_status_label(False)
-        else:
-            self.undo_button.setText("Undo")
-            self.redo_button.setText("Redo")
-            self.show_status_label(True)
-            
-            # Resize buttons for text
-            self.undo_button.setFixedSize(50, 24)
-            self.redo_button.setFixedSize(50, 24)
+        # Skip redundant relayouts/repaints when the mode is unchanged
+        if compact == self._compact_mode:
+            return
+        self._compact_mode = compact
+        
+        self.setUpdatesEnabled(False)
+        try:
+            if compact:
+                self.undo_button.setText("↶")
+                self.redo_button.setText("↷")
+                self.show_status_label(False)
+                
+                # Restore compact button size
+                self.undo_button.setFixedSize(24, 24)
+                self.redo_button.setFixedSize(24, 24)
+            else:
+                self.undo_button.setText("Undo")
+                self.redo_button.setText("Redo")
+                self.show_status_label(True)
+                
+                # Resize buttons for text
+                self.undo_button.setFixedSize(50, 24)
+                self.redo_button.setFixedSize(50, 24)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def get_state_info(self) -> dict:
         """
@@ -239,5 +271,5 @@ class UndoRedoWidget(QWidget):
             "undo_available": self.undo_available,
             "redo_available": self.redo_available,
             "current_description": self.current_description,
-            "compact_mode": self.undo_button.text() in ["↶", "↷"]
+            "compact_mode": self._compact_mode
         }
@@ -9,16 +9,246 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                            QFormLayout, QProgressBar)
 from PyQt5.QtCore import Qt, pyqtSignal, QThread
 
-from ..core.color_utils import (complementary_color, triadic_colors, 
-                              analogous_colors, rotate_hue, 
-                              adjust_brightness, adjust_saturation)
+import copy
+import numpy as np
+
+from ..core.gradient import ColorStop
+
+
+def _rgb_to_hsv_vec(rgb):
+    """
+    Convert an array of RGB colors to HSV.
+    
+    Args:
+        rgb: Float array of shape (..., 3) with components in range 0-1
+        
+    Returns:
+        Tuple (h, s, v) of arrays with all components in range 0-1
+    """
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    v = rgb.max(axis=-1)
+    delta = v - rgb.min(axis=-1)
+    chromatic = delta > 0
+    
+    # Branchless hue: distance of each channel from the max, pre-scaled to
+    # sixths of the wheel; the channel that holds the max selects the sector
+    diff = (v[..., None] - rgb) / (6.0 * np.where(chromatic, delta, 1.0))[..., None]
+    rdif, gdif, bdif = diff[..., 0], diff[..., 1], diff[..., 2]
+    h = np.where(r == v, bdif - gdif,
+                 np.where(g == v, 1.0 / 3.0 + rdif - bdif, 2.0 / 3.0 + gdif - rdif))
+    h = np.where(chromatic, np.mod(h, 1.0), 0.0)
+    s = np.where(chromatic, delta / np.where(chromatic, v, 1.0), 0.0)
+    
+    return h, s, v
+
+
+def _hsv_to_rgb_vec(h, s, v):
+    """
+    Convert arrays of HSV components back to RGB.
+    
+    Args:
+        h: Hue array in range 0-1
+        s: Saturation array in range 0-1
+        v: Value array in range 0-1
+        
+    Returns:
+        Float array of shape (..., 3) with components in range 0-1
+    """
+    h6 = h * 6.0
+    sector = np.floor(h6)
+    f = h6 - sector
+    sector = sector.astype(np.int64) % 6
+    
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+    
+    conditions = [sector == i for i in range(6)]
+    r = np.select(conditions, [v, q, p, p, t, v])
+    g = np.select(conditions, [t, v, v, q, p, p])
+    b = np.select(conditions, [p, p, t, v, v, q])
+    
+    return np.stack([r, g, b], axis=-1)
+
+
+def _apply_hsv(rgb, dh=0.0, ds_mul=1.0, dv_mul=1.0):
+    """
+    Rotate hue and scale saturation and value in a single HSV round-trip.
+    
+    Each adjustment may be a scalar or a 1-D array with one value per
+    variation; arrays are broadcast against the color axis.
+    
+    Args:
+        rgb: uint8 array of shape (N, 3)
+        dh: Hue rotation in degrees
+        ds_mul: Saturation factor (1 is unchanged)
+        dv_mul: Value factor (1 is unchanged)
+        
+    Returns:
+        uint8 array of shape (N, 3), or (variations, N, 3) when any
+        adjustment is an array
+    """
+    kernel = _get_hsv_kernel()
+    if kernel is not None:
+        return _apply_hsv_jit(kernel, rgb, dh, ds_mul, dv_mul)
+    
+    return _apply_hsv_numpy(rgb, dh, ds_mul, dv_mul)
+
+
+def _apply_hsv_numpy(rgb, dh=0.0, ds_mul=1.0, dv_mul=1.0):
+    """NumPy implementation of _apply_hsv."""
+    h, s, v = _rgb_to_hsv_vec(rgb.astype(np.float64) / 255.0)
+    
+    dh = np.asarray(dh, dtype=np.float64)[..., None]
+    ds_mul = np.asarray(ds_mul, dtype=np.float64)[..., None]
+    dv_mul = np.asarray(dv_mul, dtype=np.float64)[..., None]
+    
+    h = (h + dh / 360.0) % 1.0
+    s = np.clip(s * ds_mul, 0.0, 1.0)
+    v = np.clip(v * dv_mul, 0.0, 1.0)
+    
+    h, s, v = np.broadcast_arrays(h, s, v)
+    return np.clip(_hsv_to_rgb_vec(h, s, v) * 255, 0, 255).astype(np.uint8)
+
+
+# Numba is optional; the JIT kernel is compiled on first use when available
+_HSV_JIT_AVAILABLE = None
+_hsv_kernel = None
+_prange = range
+
+
+def _hsv_transform_kernel(rgb, dh, ds_mul, dv_mul, out):
+    """
+    HSV adjustment over every (variation, stop) pair, compiled with Numba
+    when it is installed.
+    
+    Mirrors the _rgb_to_hsv_vec / _hsv_to_rgb_vec arithmetic step for step
+    so both paths produce identical colors.
+    
+    Args:
+        rgb: uint8 array of shape (N, 3)
+        dh: Hue rotations as fractions of the wheel, one per variation
+        ds_mul: Saturation factors, one per variation
+        dv_mul: Value factors, one per variation
+        out: uint8 array of shape (variations, N, 3) receiving the result
+    """
+    count = rgb.shape[0]
+    for k in _prange(dh.shape[0] * count):
+        j = k // count
+        i = k - j * count
+        
+        r = rgb[i, 0] / 255.0
+        g = rgb[i, 1] / 255.0
+        b = rgb[i, 2] / 255.0
+        v = max(r, g, b)
+        delta = v - min(r, g, b)
+        
+        h = 0.0
+        s = 0.0
+        if delta > 0:
+            rdif = (v - r) / (6.0 * delta)
+            gdif = (v - g) / (6.0 * delta)
+            bdif = (v - b) / (6.0 * delta)
+            if r == v:
+                h = bdif - gdif
+            elif g == v:
+                h = 1.0 / 3.0 + rdif - bdif
+            else:
+                h = 2.0 / 3.0 + gdif - rdif
+            h = h % 1.0
+            s = delta / v
+        
+        h = (h + dh[j]) % 1.0
+        s = min(max(s * ds_mul[j], 0.0), 1.0)
+        v = min(max(v * dv_mul[j], 0.0), 1.0)
+        
+        h6 = h * 6.0
+        sector = np.floor(h6)
+        f = h6 - sector
+        sector = int(sector) % 6
+        p = v * (1 - s)
+        q = v * (1 - s * f)
+        t = v * (1 - s * (1 - f))
+        
+        if sector == 0:
+            r, g, b = v, t, p
+        elif sector == 1:
+            r, g, b = q, v, p
+        elif sector == 2:
+            r, g, b = p, v, t
+        elif sector == 3:
+            r, g, b = p, q, v
+        elif sector == 4:
+            r, g, b = t, p, v
+        else:
+            r, g, b = v, p, q
+        
+        out[j, i, 0] = int(min(max(r * 255, 0.0), 255.0))
+        out[j, i, 1] = int(min(max(g * 255, 0.0), 255.0))
+        out[j, i, 2] = int(min(max(b * 255, 0.0), 255.0))
+
+
+def _get_hsv_kernel():
+    """Return the compiled HSV kernel, or None when Numba is unavailable."""
+    global _HSV_JIT_AVAILABLE, _hsv_kernel, _prange
+    
+    if _HSV_JIT_AVAILABLE is None:
+        try:
+            import numba
+        except ImportError:
+            _HSV_JIT_AVAILABLE = False
+        else:
+            _prange = numba.prange
+            _hsv_kernel = numba.njit(cache=True, parallel=True)(_hsv_transform_kernel)
+            _HSV_JIT_AVAILABLE = True
+    
+    return _hsv_kernel
+
+
+def _apply_hsv_jit(kernel, rgb, dh, ds_mul, dv_mul):
+    """Run the compiled HSV kernel over all variations in one call."""
+    params = np.broadcast_arrays(np.asarray(dh, dtype=np.float64) / 360.0,
+                                 np.asarray(ds_mul, dtype=np.float64),
+                                 np.asarray(dv_mul, dtype=np.float64))
+    scalar = params[0].ndim == 0
+    dh, ds_mul, dv_mul = (np.ascontiguousarray(np.atleast_1d(param)) for param in params)
+    
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    out = np.empty((len(dh), len(rgb), 3), dtype=np.uint8)
+    kernel(rgb, dh, ds_mul, dv_mul, out)
+    
+    return out[0] if scalar else out
+
+
+def _scale_value_lut(rgb, factors):
+    """
+    Scale HSV value through a per-variation lookup table.
+    
+    Scaling V with hue and saturation fixed multiplies all three channels
+    by min(factor, 255 / max). That multiplier only depends on the 8-bit
+    max channel, so one 256-entry table per factor covers every stop.
+    
+    Args:
+        rgb: uint8 array of shape (N, 3)
+        factors: 1-D array of value factors, one per variation
+        
+    Returns:
+        uint8 array of shape (len(factors), N, 3)
+    """
+    levels = np.arange(256, dtype=np.float64)
+    levels[0] = 1.0  # Black stays black for any factor
+    table = np.minimum(np.asarray(factors, dtype=np.float64)[:, None], 255.0 / levels)
+    
+    scale = np.take(table, rgb.max(axis=1), axis=1)
+    scaled = rgb[None, :, :].astype(np.float64) * scale[..., None]
+    return np.clip(scaled, 0, 255).astype(np.uint8)
 
 
 class BatchGenerationThread(QThread):
     """Thread for batch gradient generation."""
     
     progress = pyqtSignal(int)
-    gradient_generated = pyqtSignal(object, str)
+    batch_ready = pyqtSignal(list)  # List of (gradient, name) tuples
     finished = pyqtSignal()
     
     def __init__(self, base_gradient, operation, count, options):
@@ -27,6 +257,8 @@ class BatchGenerationThread(QThread):
         self.operation = operation
         self.count = count
         self.options = options
+        self._results = []
+        self._last_progress = -1
     
     def run(self):
         """Run the batch generation."""
@@ -40,120 +272,180 @@ class BatchGenerationThread(QThread):
             "Analogous": self._generate_analogous
         }
         
+        # Clone once for metadata and read the base stops once for all variations
+        self._template = self.base_gradient.clone()
+        self._base_positions, self._base_colors = self._snapshot_stops()
+        
         # Use the appropriate generation method
+        self._results = []
+        self._last_progress = -1
         generate_method = operations.get(self.operation, self._generate_hue_rotations)
         generate_method()
         
+        # Hand all results across the thread boundary in one emission
+        self.batch_ready.emit(self._results)
         self.finished.emit()
     
+    def _snapshot_stops(self):
+        """
+        Capture the base gradient's stops once for all variations.
+        
+        Returns:
+            Tuple (positions, colors) with an immutable tuple of positions
+            and a uint8 array of shape (N, 3) with the stop colors
+        """
+        stops = self.base_gradient.get_color_stops()
+        positions = tuple(position for position, _ in stops)
+        colors = np.array([color for _, color in stops], dtype=np.uint8).reshape(-1, 3)
+        return positions, colors
+    
+    def _fast_clone_with_stops(self, positions, colors):
+        """
+        Build a copy of the template gradient with the given stops.
+        
+        The stops are assigned directly in their existing order, avoiding
+        a full clone and per-stop add_color_stop calls.
+        
+        Args:
+            positions: Sequence of stop positions
+            colors: uint8 array of shape (N, 3) with the stop colors
+            
+        Returns:
+            New Gradient instance
+        """
+        gradient = copy.copy(self._template)
+        gradient._metadata = copy.copy(self._template._metadata)
+        gradient._seamless = copy.copy(self._template._seamless)
+        gradient._color_stops = [
+            ColorStop(position, tuple(color))
+            for position, color in zip(positions, colors.tolist())
+        ]
+        return gradient
+    
     def _generate_hue_rotations(self):
         """Generate hue rotation variations."""
-        for i in range(self.count):
-            gradient = self.base_gradient.clone()
-            name = f"{self.base_gradient.get_name()} Hue {i+1}"
-            
-            # Rotate hue progressively
-            angle = (360 / self.count) * i
-            self._apply_color_transformation(gradient, 
-                                           lambda color: rotate_hue(color, angle))
-            
-            self._update_progress(i)
-            self.gradient_generated.emit(gradient, name)
+        # Rotate hue progressively
+        angles = np.linspace(0.0, 360.0, self.count, endpoint=False)
+        self._emit_variations("Hue", self._batch_transform(self._base_colors, "hue", angles))
     
     def _generate_brightness_variations(self):
         """Generate brightness variations."""
-        for i in range(self.count):
-            gradient = self.base_gradient.clone()
-            name = f"{self.base_gradient.get_name()} Brightness {i+1}"
-            
-            # Create brightness variations
-            factor = 0.5 + (1.0 * i / max(1, self.count - 1))
-            self._apply_color_transformation(gradient, 
-                                           lambda color: adjust_brightness(color, factor))
-            
-            self._update_progress(i)
-            self.gradient_generated.emit(gradient, name)
+        factors = np.linspace(0.5, 1.5, self.count)
+        self._emit_variations("Brightness",
+                              self._batch_transform(self._base_colors, "brightness", factors))
     
     def _generate_saturation_variations(self):
         """Generate saturation variations."""
-        for i in range(self.count):
-            gradient = self.base_gradient.clone()
-            name = f"{self.base_gradient.get_name()} Saturation {i+1}"
-            
-            # Create saturation variations
-            factor = 0.5 + (1.0 * i / max(1, self.count - 1))
-            self._apply_color_transformation(gradient, 
-                                           lambda color: adjust_saturation(color, factor))
+        factors = np.linspace(0.5, 1.5, self.count)
+        self._emit_variations("Saturation",
+                              self._batch_transform(self._base_colors, "saturation", factors))
+    
+    def _emit_variations(self, label, variant_colors):
+        """
+        Emit one gradient per row of precomputed stop colors.
+        
+        Args:
+            label: Variation label appended to the base gradient name
+            variant_colors: uint8 array of shape (count, N, 3)
+        """
+        base_name = self.base_gradient.get_name()
+        for i, new_colors in enumerate(variant_colors):
+            gradient = self._fast_clone_with_stops(self._base_positions, new_colors)
             
-            self._update_progress(i)
-            self.gradient_generated.emit(gradient, name)
+            self._update_progress(i, len(variant_colors))
+            self._add_result(gradient, f"{base_name} {label} {i+1}")
     
     def _generate_complementary(self):
         """Generate complementary variation."""
         # Original gradient
-        gradient = self.base_gradient.clone()
+        gradient = self._fast_clone_with_stops(self._base_positions, self._base_colors)
         name = f"{self.base_gradient.get_name()} Original"
-        self._update_progress(0)
-        self.gradient_generated.emit(gradient, name)
+        self._update_progress(0, 2)
+        self._add_result(gradient, name)
         
         # Complementary gradient
-        comp_gradient = self.base_gradient.clone()
+        # A 180 degree hue rotation keeps the max and min channels and
+        # reflects each channel between them, so no HSV round-trip is needed
+        rgb = self._base_colors.astype(np.int16)
+        comp_colors = (rgb.max(axis=1, keepdims=True) + rgb.min(axis=1, keepdims=True)
+                       - rgb).astype(np.uint8)
+        comp_gradient = self._fast_clone_with_stops(self._base_positions, comp_colors)
         comp_name = f"{self.base_gradient.get_name()} Complementary"
         
-        self._apply_color_transformation(comp_gradient, complementary_color)
-        
-        self._update_progress(50)
-        self.gradient_generated.emit(comp_gradient, comp_name)
+        self._update_progress(1, 2)
+        self._add_result(comp_gradient, comp_name)
     
     def _generate_triadic(self):
         """Generate triadic variations."""
-        # Get all triadic variations for each color
-        for i in range(3):
-            gradient = self.base_gradient.clone()
-            name = f"{self.base_gradient.get_name()} Triadic {i+1}"
-            
-            def transform_color(color):
-                triadic = triadic_colors(color)
-                return triadic[i]
-            
-            self._apply_color_transformation(gradient, transform_color)
-            
-            self._update_progress(i * 33)
-            self.gradient_generated.emit(gradient, name)
+        # Compute all three color wheel shifts for every stop at once
+        variants = self._batch_transform(self._base_colors, "hue", (0.0, 120.0, 240.0))
+        variants[0] = self._base_colors
+        self._emit_variations("Triadic", variants)
     
     def _generate_analogous(self):
         """Generate analogous variations."""
-        # Get all analogous variations for each color
-        for i in range(3):
-            gradient = self.base_gradient.clone()
-            name = f"{self.base_gradient.get_name()} Analogous {i+1}"
-            
-            def transform_color(color):
-                analogous = analogous_colors(color)
-                return analogous[i]
-            
-            self._apply_color_transformation(gradient, transform_color)
+        # Compute all three color wheel shifts for every stop at once
+        variants = self._batch_transform(self._base_colors, "hue", (-30.0, 0.0, 30.0))
+        variants[1] = self._base_colors
+        self._emit_variations("Analogous", variants)
+    
+    def _batch_transform(self, rgb, op, param):
+        """
+        Apply an HSV adjustment to an array of colors in one pass.
+        
+        Args:
+            rgb: uint8 array of shape (N, 3)
+            op: "hue" (param in degrees), "brightness" or "saturation"
+                (param is a multiplicative factor)
+            param: Amount of the adjustment, either a scalar or a 1-D array
+                with one value per variation
             
-            self._update_progress(i * 33)
-            self.gradient_generated.emit(gradient, name)
-    
-    def _apply_color_transformation(self, gradient, transform_func):
-        """Apply a color transformation to each stop in the gradient."""
-        new_stops = []
-        
-        for position, color in gradient.get_color_stops():
-            new_color = transform_func(color)
-            new_stops.append((position, new_color))
-        
-        # Clear and rebuild stops
-        gradient._color_stops = []
-        for position, color in new_stops:
-            gradient.add_color_stop(position, color)
-    
-    def _update_progress(self, current_step):
-        """Update the progress bar."""
-        progress = int((current_step + 1) / self.count * 100)
-        self.progress.emit(progress)
+        Returns:
+            Adjusted uint8 array of shape (N, 3) for a scalar param, or
+            (len(param), N, 3) for an array param
+        """
+        if op == "hue":
+            return _apply_hsv(rgb, dh=param)
+        if op == "brightness":
+            # Same RGB-scale formulation for every batch size, so output never
+            # depends on how many colors are processed
+            factors = np.asarray(param, dtype=np.float64)
+            scaled = _scale_value_lut(rgb, np.atleast_1d(factors))
+            return scaled[0] if factors.ndim == 0 else scaled
+        if op == "saturation":
+            return _apply_hsv(rgb, ds_mul=param)
+        raise ValueError(f"Unknown color operation: {op}")
+    
+    def _add_result(self, gradient, name):
+        """Collect a generated gradient, plus its reverse when requested."""
+        self._results.append((gradient, name))
+        
+        if self.options.get("reverse"):
+            # Mirroring positions needs no color math
+            reversed_gradient = copy.copy(gradient)
+            reversed_gradient._metadata = copy.copy(gradient._metadata)
+            reversed_gradient._seamless = copy.copy(gradient._seamless)
+            reversed_gradient._color_stops = [
+                ColorStop(1.0 - stop.position, stop.color)
+                for stop in reversed(gradient._color_stops)
+            ]
+            self._results.append((reversed_gradient, f"{name} Reversed"))
+    
+    def _update_progress(self, current_step, total):
+        """
+        Update the progress bar.
+        
+        Args:
+            current_step: Index of the result being emitted
+            total: Number of results the operation emits
+        """
+        progress = int((current_step + 1) / total * 100)
+        
+        # Emit at most ~20 updates per run, always including completion
+        step = max(1, 100 // min(20, total))
+        if progress >= self._last_progress + step or (progress >= 100 > self._last_progress):
+            self._last_progress = progress
+            self.progress.emit(progress)
 
 
 class BatchOperationsDialog(QDialog):
@@ -269,15 +561,15 @@ class BatchOperationsDialog(QDialog):
         
         # Connect signals
         self.thread.progress.connect(self.progress_bar.setValue)
-        self.thread.gradient_generated.connect(self.on_gradient_generated)
+        self.thread.batch_ready.connect(self.on_batch_ready)
         self.thread.finished.connect(self.on_generation_finished)
         
         # Start thread
         self.thread.start()
     
-    def on_gradient_generated(self, gradient, name):
-        """Handle a generated gradient."""
-        self.generated_gradients.append((gradient, name))
+    def on_batch_ready(self, gradients):
+        """Handle the generated gradients."""
+        self.generated_gradients = gradients
     
     def on_generation_finished(self):
         """Handle generation completion."""
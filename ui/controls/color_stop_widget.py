@@ -4,10 +4,14 @@ Color Stop Widget Module for Gradient Generator
 
 This module provides the UI widget for editing a single color stop in the gradient.
 """
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QPushButton, 
-                           QLabel, QDoubleSpinBox, QColorDialog, QSpinBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QColor
+                           QLabel, QDoubleSpinBox, QColorDialog, QLineEdit)
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QRegExp, QSignalBlocker
+from PyQt5.QtGui import QColor, QPixmap, QIcon, QRegExpValidator
+
+from ...core.color_utils import rgb_to_hex, hex_to_rgb
 
 
 class ColorStopWidget(QWidget):
@@ -48,30 +52,26 @@ class ColorStopWidget(QWidget):
         # Color button
         self.color_button = QPushButton()
         self.color_button.setFixedSize(QSize(24, 24))
+        self.color_button.setIconSize(QSize(18, 18))
+        self.color_button.setStyleSheet("""
+            QPushButton {
+                border: 1px solid #888;
+            }
+            QPushButton:hover {
+                border: 1px solid white;
+            }
+        """)
         self.update_color_button()
         self.color_button.clicked.connect(self.on_color_button_clicked)
         layout.addWidget(self.color_button)
         
-        # Color values
-        r, g, b = self.color
-        
-        self.r_spin = QSpinBox()
-        self.r_spin.setRange(0, 255)
-        self.r_spin.setValue(r)
-        self.r_spin.valueChanged.connect(self.on_r_changed)
-        layout.addWidget(self.r_spin)
-        
-        self.g_spin = QSpinBox()
-        self.g_spin.setRange(0, 255)
-        self.g_spin.setValue(g)
-        self.g_spin.valueChanged.connect(self.on_g_changed)
-        layout.addWidget(self.g_spin)
-        
-        self.b_spin = QSpinBox()
-        self.b_spin.setRange(0, 255)
-        self.b_spin.setValue(b)
-        self.b_spin.valueChanged.connect(self.on_b_changed)
-        layout.addWidget(self.b_spin)
+        # Color value as a single hex field
+        self.hex_edit = QLineEdit(rgb_to_hex(*self.color))
+        self.hex_edit.setValidator(QRegExpValidator(QRegExp("#?[0-9A-Fa-f]{6}")))
+        self.hex_edit.setMaxLength(7)
+        self.hex_edit.setFixedWidth(70)
+        self.hex_edit.editingFinished.connect(self.on_hex_edited)
+        layout.addWidget(self.hex_edit)
         
         # Delete button
         self.delete_button = QPushButton("×")
@@ -81,17 +81,16 @@ class ColorStopWidget(QWidget):
     
     def update_color_button(self):
         """Update the color button to reflect the current color."""
-        r, g, b = self.color
-        color_style = f"background-color: rgb({r}, {g}, {b});"
-        self.color_button.setStyleSheet(f"""
-            QPushButton {{
-                {color_style}
-                border: 1px solid #888;
-            }}
-            QPushButton:hover {{
-                border: 1px solid white;
-            }}
-        """)
+        # Use a swatch icon rather than restyling, which re-polishes the button
+        self.color_button.setIcon(QIcon(self._swatch(*self.color)))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _swatch(r, g, b):
+        """Return a shared solid-color pixmap for the color button."""
+        pixmap = QPixmap(18, 18)
+        pixmap.fill(QColor(r, g, b))
+        return pixmap
     
     def on_color_button_clicked(self):
         """Handle color button click - open color dialog."""
@@ -102,47 +101,49 @@ class ColorStopWidget(QWidget):
             self.color = (color.red(), color.green(), color.blue())
             self.update_color_button()
             
-            # Update RGB spinners
-            self.r_spin.blockSignals(True)
-            self.g_spin.blockSignals(True)
-            self.b_spin.blockSignals(True)
-            
-            self.r_spin.setValue(color.red())
-            self.g_spin.setValue(color.green())
-            self.b_spin.setValue(color.blue())
-            
-            self.r_spin.blockSignals(False)
-            self.g_spin.blockSignals(False)
-            self.b_spin.blockSignals(False)
+            self.hex_edit.setText(rgb_to_hex(*self.color))
             
             # Emit signal
             self.color_changed.emit(self.index, self.color)
     
+    def set_stop(self, index, position, color):
+        """
+        Update the widget in place to show a different stop.
+        
+        Args:
+            index: Display index of the stop
+            position: Stop position (0-1)
+            color: Stop color as (r, g, b)
+        """
+        if index != self.index:
+            self.index = index
+            self.index_label.setText(f"#{index+1}")
+        
+        if position != self.position:
+            self.position = position
+            blocker = QSignalBlocker(self.position_spin)
+            self.position_spin.setValue(position)
+            blocker.unblock()
+        
+        if tuple(color) != tuple(self.color):
+            self.color = color
+            self.hex_edit.setText(rgb_to_hex(*color))
+            self.update_color_button()
+    
     def on_position_changed(self, value):
         """Handle position change."""
         self.position = value
         self.position_changed.emit(self.index, value)
     
-    def on_r_changed(self, value):
-        """Handle red component change."""
-        _, g, b = self.color
-        self.color = (value, g, b)
-        self.update_color_button()
-        self.color_changed.emit(self.index, self.color)
-    
-    def on_g_changed(self, value):
-        """Handle green component change."""
-        r, _, b = self.color
-        self.color = (r, value, b)
-        self.update_color_button()
-        self.color_changed.emit(self.index, self.color)
-    
-    def on_b_changed(self, value):
-        """Handle blue component change."""
-        r, g, _ = self.color
-        self.color = (r, g, value)
-        self.update_color_button()
-        self.color_changed.emit(self.index, self.color)
+    def on_hex_edited(self):
+        """Handle a committed hex color edit."""
+        color = hex_to_rgb(self.hex_edit.text())
+        self.hex_edit.setText(rgb_to_hex(*color))
+        
+        if color != tuple(self.color):
+            self.color = color
+            self.update_color_button()
+            self.color_changed.emit(self.index, self.color)
     
     def on_delete(self):
         """Handle delete button click."""
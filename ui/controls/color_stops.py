@@ -6,11 +6,12 @@ Streamlined random gradient UI with slider for color stops count and hidden seed
 All features and functionality retained while saving space.
 """
 import random
+import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                            QLabel, QScrollArea, QGroupBox, QSlider,
                            QFormLayout, QMessageBox, QRadioButton,
-                           QButtonGroup, QCheckBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+                           QButtonGroup, QCheckBox, QMainWindow)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread
 
 from .color_stop_widget import ColorStopWidget
 
@@ -30,24 +31,108 @@ except ImportError:
             return grad
 
 
+class RandomGradientThread(QThread):
+    """Thread that runs the random gradient generator off the UI thread."""
+    
+    gradient_ready = pyqtSignal(object)
+    generation_failed = pyqtSignal(str)
+    
+    def __init__(self, scheme_name, num_stops, random_seed, flags, regenerate=False):
+        super().__init__()
+        self.scheme_name = scheme_name
+        self.num_stops = num_stops
+        self.random_seed = random_seed
+        self.flags = flags
+        self.regenerate = regenerate  # Repeating the previous seed
+    
+    def run(self):
+        """Run the generator and report the result."""
+        try:
+            new_gradient = RandomGradientGenerator.generate_random_gradient(
+                num_stops=self.num_stops, random_seed=self.random_seed, **self.flags
+            )
+            if new_gradient is None:
+                raise Exception("Generator returned None")
+            self.gradient_ready.emit(new_gradient)
+        except Exception as e:
+            self.generation_failed.emit(str(e))
+
+
 class ColorStopsEditor(QWidget):
     """Streamlined widget for editing color stops with refactored randomization UI."""
     
     stops_changed = pyqtSignal()
+    stops_replaced = pyqtSignal()  # All stops were regenerated or redistributed
     
     MAX_COLOR_STOPS = RandomGradientGenerator.MAX_COLOR_STOPS
     DEFAULT_STOPS = RandomGradientGenerator.DEFAULT_STOPS
     
+    # Styles for the editor's own labels and buttons, parsed once per editor
+    _STYLE_SHEET = """
+        QLabel#stops_info_label {
+            color: #888; font-style: italic; padding: 4px;
+        }
+        QLabel#adjustments_info_label {
+            color: #888; font-style: italic; padding: 8px;
+            background-color: #333; border-radius: 4px; margin: 5px;
+        }
+        QLabel#status_label {
+            color: #888; font-style: italic; font-size: 11px;
+        }
+        QPushButton#generate_button {
+            font-weight: bold;
+            padding: 8px;
+            background-color: #2a7a2a;
+            border: 1px solid #555;
+            border-radius: 4px;
+            color: white;
+        }
+        QPushButton#generate_button:hover {
+            background-color: #3a8a3a;
+        }
+        QPushButton#generate_button:pressed {
+            background-color: #1a6a1a;
+        }
+    """
+    
+    # Scheme radio buttons: (name, tooltip, generator flags)
+    _SCHEMES = (
+        ("Random Spectrum", "Generate completely random colors across full spectrum",
+         {"harmonious": False}),
+        ("Harmonious", "Generate colors with pleasing relationships",
+         {"harmonious": True}),
+        ("Monochromatic", "Single hue with variations in brightness and saturation",
+         {"monochromatic": True}),
+        ("Analogous", "Colors adjacent on the color wheel",
+         {"analogous": True}),
+        ("Complementary", "Colors from opposite sides of the color wheel",
+         {"complementary": True}),
+        ("Triadic", "Three colors evenly spaced on the color wheel",
+         {"triadic": True})
+    )
+    
     def __init__(self, gradient_model):
         super().__init__()
         self.gradient_model = gradient_model
         self.color_stops = []
+        self._applied_stops = []  # (position, color) shown by each row
+        self._widget_pool = []  # Hidden rows kept in the layout for reuse
+        self._pos_to_index = None  # Rounded position -> model index cache
         self._internal_seed = None  # Hidden seed for reproducibility
+        self._generation_thread = None
+        self._main_window = None  # Cached once the editor is inside a QMainWindow
+        
+        # Coalesce row re-sorting while a position is being edited
+        self._pending_update_timer = QTimer(self)
+        self._pending_update_timer.setSingleShot(True)
+        self._pending_update_timer.timeout.connect(self.update_from_model)
+        
         self.init_ui()
         self.update_from_model()
     
     def init_ui(self):
         """Initialize the streamlined UI components."""
+        self.setStyleSheet(self._STYLE_SHEET)
         main_layout = QVBoxLayout(self)
         
         # Color Stops Section
@@ -98,7 +183,7 @@ class ColorStopsEditor(QWidget):
         
         # Info label
         info_label = QLabel("💡 For advanced distribution controls, use the Distribution tab")
-        info_label.setStyleSheet("color: #888; font-style: italic; padding: 4px;")
+        info_label.setObjectName("stops_info_label")
         info_label.setWordWrap(True)
         stops_layout.addWidget(info_label)
         
@@ -112,8 +197,7 @@ class ColorStopsEditor(QWidget):
         info_label = QLabel(
             "💡 <b>Color Adjustments:</b> Modify brightness, contrast, and hue in the Adjustments tab"
         )
-        info_label.setStyleSheet("color: #888; font-style: italic; padding: 8px; "
-                               "background-color: #333; border-radius: 4px; margin: 5px;")
+        info_label.setObjectName("adjustments_info_label")
         info_label.setWordWrap(True)
         main_layout.addWidget(info_label)
         
@@ -128,18 +212,11 @@ class ColorStopsEditor(QWidget):
         self.scheme_button_group = QButtonGroup(self)
         scheme_layout = QVBoxLayout()
         
-        schemes = [
-            ("Random Spectrum", "Generate completely random colors across full spectrum"),
-            ("Harmonious", "Generate colors with pleasing relationships"),
-            ("Monochromatic", "Single hue with variations in brightness and saturation"),
-            ("Analogous", "Colors adjacent on the color wheel"),
-            ("Complementary", "Colors from opposite sides of the color wheel"),
-            ("Triadic", "Three colors evenly spaced on the color wheel")
-        ]
-        
-        for i, (name, tooltip) in enumerate(schemes):
+        for i, (name, tooltip, flags) in enumerate(self._SCHEMES):
             radio = QRadioButton(name)
             radio.setToolTip(tooltip)
+            radio.setProperty("scheme_name", name)
+            radio.setProperty("scheme_flags", flags)
             self.scheme_button_group.addButton(radio, i)
             scheme_layout.addWidget(radio)
         
@@ -154,7 +231,12 @@ class ColorStopsEditor(QWidget):
         self.random_stops_slider = QSlider(Qt.Horizontal)
         self.random_stops_slider.setRange(3, self.MAX_COLOR_STOPS)
         self.random_stops_slider.setValue(10)
-        self.random_stops_slider.valueChanged.connect(self._update_stops_label)
+        
+        # Refresh the value label once the slider settles rather than per step
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.timeout.connect(self._update_stops_label)
+        self.random_stops_slider.valueChanged.connect(lambda: self._label_timer.start(60))
         
         self.stops_value_label = QLabel("10")
         self.stops_value_label.setFixedWidth(30)
@@ -171,39 +253,24 @@ class ColorStopsEditor(QWidget):
         # Generate button with enhanced styling
         self.generate_button = QPushButton("Generate Random Gradient")
         self.generate_button.clicked.connect(self.generate_random_gradient)
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                font-weight: bold; 
-                padding: 8px; 
-                background-color: #2a7a2a;
-                border: 1px solid #555;
-                border-radius: 4px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #3a8a3a;
-            }
-            QPushButton:pressed {
-                background-color: #1a6a1a;
-            }
-        """)
+        self.generate_button.setObjectName("generate_button")
         random_layout.addWidget(self.generate_button)
         
         # Compact status
         self.status_label = QLabel("Click 'Generate Random Gradient' to create a new random gradient")
-        self.status_label.setStyleSheet("color: #888; font-style: italic; font-size: 11px;")
+        self.status_label.setObjectName("status_label")
         self.status_label.setWordWrap(True)
         random_layout.addWidget(self.status_label)
         
         return random_group
     
-    def _update_stops_label(self, value):
+    def _update_stops_label(self):
         """Update the stops count label when slider changes."""
-        self.stops_value_label.setText(str(value))
+        self.stops_value_label.setText(str(self.random_stops_slider.value()))
     
     def _generate_internal_seed(self):
         """Generate a new internal seed for reproducibility."""
-        self._internal_seed = random.randint(1, 999999)
+        self._internal_seed = random.getrandbits(20) or 1
         return self._internal_seed
     
     def add_color_stop(self):
@@ -214,6 +281,7 @@ class ColorStopsEditor(QWidget):
             return
         
         self.gradient_model.add_color_stop(0.5, (255, 255, 255))
+        self._pos_to_index = None
         self.update_from_model()
         self.stops_changed.emit()
     
@@ -226,12 +294,9 @@ class ColorStopsEditor(QWidget):
         
         colors = [stop.color for stop in self.color_stops]
         
-        # Generate random positions maintaining endpoints
-        positions = [0.0]
-        if len(colors) > 2:
-            for _ in range(len(colors) - 2):
-                positions.append(random.uniform(0.01, 0.99))
-        positions.append(1.0)
+        # Generate sorted random positions maintaining endpoints
+        inner = np.sort(np.random.uniform(0.01, 0.99, size=len(colors) - 2))
+        positions = [0.0] + inner.tolist() + [1.0]
         
         self._apply_new_stops(positions, colors)
     
@@ -242,8 +307,8 @@ class ColorStopsEditor(QWidget):
             return
         
         positions = [stop.position for stop in self.color_stops]
-        colors = [(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)) 
-                 for _ in range(len(positions))]
+        rgb = np.random.randint(0, 256, size=(len(positions), 3))
+        colors = [tuple(row) for row in rgb.tolist()]
         
         self._apply_new_stops(positions, colors)
     
@@ -257,94 +322,137 @@ class ColorStopsEditor(QWidget):
         colors = [stop.color for stop in self.color_stops]
         num_stops = len(colors)
         
-        # Calculate even positions
-        if num_stops == 1:
-            positions = [0.5]
-        elif num_stops == 2:
-            positions = [0.0, 1.0]
-        else:
-            positions = [i / (num_stops - 1) for i in range(num_stops)]
+        # Calculate even positions (endpoints included)
+        positions = np.linspace(0.0, 1.0, num_stops).tolist()
         
         self._apply_new_stops(positions, colors)
         
         # Show status
-        try:
-            main_window = self.window()
-            if hasattr(main_window, 'statusBar'):
-                main_window.statusBar().showMessage(
-                    f"Distributed {num_stops} color stops evenly", 3000)
-        except:
-            pass
+        if self._main_window is None:
+            window = self.window()
+            if not isinstance(window, QMainWindow):
+                return
+            self._main_window = window
+        self._main_window.statusBar().showMessage(
+            f"Distributed {num_stops} color stops evenly", 3000)
     
     def generate_random_gradient(self):
         """Generate a random gradient with streamlined parameters."""
-        try:
-            scheme_id = self.scheme_button_group.checkedId()
-            num_stops = self.random_stops_slider.value()  # CHANGED: Get from slider
-            
-            # Generate internal seed for reproducibility (hidden from user)
-            random_seed = self._generate_internal_seed()
-            
-            # Map scheme ID to flags
-            scheme_flags = [
-                {"harmonious": False},      # Random Spectrum
-                {"harmonious": True},       # Harmonious  
-                {"monochromatic": True},    # Monochromatic
-                {"analogous": True},        # Analogous
-                {"complementary": True},    # Complementary
-                {"triadic": True}           # Triadic
-            ]
-            
-            flags = scheme_flags[scheme_id] if 0 <= scheme_id < len(scheme_flags) else {}
-            
-            # Generate gradient
-            new_gradient = RandomGradientGenerator.generate_random_gradient(
-                num_stops=num_stops, random_seed=random_seed, **flags
-            )
-            
-            if new_gradient is None:
-                raise Exception("Generator returned None")
-            
-            # Apply to model
-            self.gradient_model._color_stops = []
-            for stop in new_gradient.get_color_stop_objects():
-                self.gradient_model.add_color_stop(stop.position, stop.color)
-            
-            self.gradient_model.set_name(new_gradient.get_name())
-            self.gradient_model.set_description(new_gradient.get_description())
-            
-            self.update_from_model()
-            self.stops_changed.emit()
-            
-            # Update status with scheme info only (no seed shown to user)
-            scheme_names = ["Random Spectrum", "Harmonious", "Monochromatic", 
-                           "Analogous", "Complementary", "Triadic"]
-            scheme_name = scheme_names[scheme_id] if 0 <= scheme_id < len(scheme_names) else "Unknown"
-            
-            status_msg = f"Generated: {scheme_name} gradient with {num_stops} random stops"
-            self.status_label.setText(status_msg)
-            
-        except Exception as e:
-            error_msg = f"Error generating random gradient: {str(e)}"
-            self.status_label.setText(error_msg)
-            QMessageBox.critical(self, "Error", f"Failed to generate random gradient: {str(e)}")
+        if self._generation_thread is not None and self._generation_thread.isRunning():
+            return
+        
+        # Generate internal seed for reproducibility (hidden from user)
+        self._start_generation(self._generate_internal_seed())
     
-    def update_from_model(self):
-        """Update UI from the gradient model."""
-        # Clear existing widgets
-        for widget in self.color_stops:
-            self.stops_layout.removeWidget(widget)
-            widget.deleteLater()
+    def _start_generation(self, random_seed, regenerate=False):
+        """
+        Start the random gradient generator on a worker thread.
+        
+        Args:
+            random_seed: Seed passed to the generator
+            regenerate: True when repeating the previous pattern
+        """
+        scheme_button = self.scheme_button_group.checkedButton()
+        num_stops = self.random_stops_slider.value()  # CHANGED: Get from slider
+        
+        # Scheme flags are stored on the radio button
+        flags = (scheme_button.property("scheme_flags") or {}) if scheme_button else {}
+        scheme_name = scheme_button.property("scheme_name") if scheme_button else "Unknown"
+        
+        # Generate in the background; the model is updated when it finishes
+        self.generate_button.setEnabled(False)
+        self._generation_thread = RandomGradientThread(scheme_name, num_stops, random_seed, flags,
+                                                       regenerate)
+        self._generation_thread.gradient_ready.connect(self._on_random_gradient_ready)
+        self._generation_thread.generation_failed.connect(self._on_random_gradient_failed)
+        self._generation_thread.start()
+    
+    def _on_random_gradient_ready(self, new_gradient):
+        """Apply a generated random gradient to the model."""
+        self.generate_button.setEnabled(True)
         
-        self.color_stops = []
+        # Apply to model
+        self.gradient_model.set_color_stops(new_gradient.get_color_stops())
+        self._pos_to_index = None
+        
+        self.gradient_model.set_name(new_gradient.get_name())
+        self.gradient_model.set_description(new_gradient.get_description())
         
+        self.update_from_model()
+        self.stops_changed.emit()
+        self.stops_replaced.emit()
+        
+        # Update status with scheme info only (no seed shown to user)
+        thread = self._generation_thread
+        if thread.regenerate:
+            status_msg = "Regenerated with same pattern"
+        else:
+            status_msg = f"Generated: {thread.scheme_name} gradient with {thread.num_stops} random stops"
+        self.status_label.setText(status_msg)
+    
+    def _on_random_gradient_failed(self, error):
+        """Report a failed random gradient generation."""
+        self.generate_button.setEnabled(True)
+        
+        error_msg = f"Error generating random gradient: {error}"
+        self.status_label.setText(error_msg)
+        QMessageBox.critical(self, "Error", f"Failed to generate random gradient: {error}")
+    
+    def cleanup(self):
+        """Stop pending updates and wait for a running generation to finish."""
+        self._pending_update_timer.stop()
+        
+        thread = self._generation_thread
+        if thread is not None and thread.isRunning():
+            # The result is no longer wanted; just let the thread exit cleanly
+            thread.gradient_ready.disconnect(self._on_random_gradient_ready)
+            thread.generation_failed.disconnect(self._on_random_gradient_failed)
+            thread.wait()
+    
+    def update_from_model(self):
+        """Update UI from the gradient model."""
         # Get and sort stops by position for display
         model_stops = self.gradient_model.get_color_stops()
+        self._rebuild_index_cache(model_stops)
         sorted_stops = sorted(model_stops, key=lambda stop: stop[0])
         
-        # Add widgets for each stop
-        for i, (position, color) in enumerate(sorted_stops):
-            self._add_stop_widget(i, position, color)
+        # Nothing to do when the rows already show exactly these stops
+        if sorted_stops == self._applied_stops:
+            return
+        
+        # Suspend repaints so the rows are laid out once
+        self.stops_container.setUpdatesEnabled(False)
+        
+        # Patch existing widgets in place, skipping rows that are unchanged
+        reused = min(len(self.color_stops), len(sorted_stops))
+        for i in range(reused):
+            if self._applied_stops[i] != sorted_stops[i]:
+                position, color = sorted_stops[i]
+                self.color_stops[i].set_stop(i, position, color)
+        
+        # Hide surplus widgets; they stay in the layout right after the
+        # visible rows, so the pool is kept in layout order
+        surplus = self.color_stops[reused:]
+        for widget in surplus:
+            widget.hide()
+        self._widget_pool[:0] = surplus
+        del self.color_stops[reused:]
+        
+        self._applied_stops = list(sorted_stops)
+        
+        # Show pooled widgets for new stops before allocating fresh ones
+        for i in range(reused, len(sorted_stops)):
+            position, color = sorted_stops[i]
+            if self._widget_pool:
+                widget = self._widget_pool.pop(0)
+                widget.set_stop(i, position, color)
+                widget.show()
+                self.color_stops.append(widget)
+            else:
+                self._add_stop_widget(i, position, color)
+        
+        self.stops_container.setUpdatesEnabled(True)
+        self.stops_container.updateGeometry()
         
         self._update_ui_state()
     
@@ -352,63 +460,76 @@ class ColorStopsEditor(QWidget):
         """Add a widget for a color stop."""
         widget = ColorStopWidget(display_index, position, color)
         
-        # Connect signals using position-based handlers
-        widget.color_changed.connect(lambda idx, clr: self._on_color_changed(position, clr))
-        widget.position_changed.connect(lambda idx, new_pos: self._on_position_changed(position, new_pos))
-        widget.delete_requested.connect(lambda idx: self._on_delete_stop(position))
+        # Rows are reused, so handlers take the display index and look up
+        # the stop that row currently shows
+        widget.color_changed.connect(self._on_color_changed)
+        widget.position_changed.connect(self._on_position_changed)
+        widget.delete_requested.connect(self._on_delete_stop)
         
         # Add to layout
         self.stops_layout.insertWidget(self.stops_layout.count() - 1, widget)
         self.color_stops.append(widget)
-        
-        self._update_ui_state()
     
-    def _on_color_changed(self, original_position, color):
+    def _on_color_changed(self, row, color):
         """Handle color change."""
-        model_index = self._find_model_index(original_position)
+        position = self._applied_stops[row][0]
+        model_index = self._find_model_index(position)
+        
+        # The row already shows the new color; record it so a later model
+        # change back to the old color is not mistaken for "unchanged"
+        self._applied_stops[row] = (position, tuple(color))
         if model_index >= 0:
             self.gradient_model.set_color_at_index(model_index, color)
             self.stops_changed.emit()
     
-    def _on_position_changed(self, original_position, new_position):
+    def _on_position_changed(self, row, new_position):
         """Handle position change."""
+        original_position, color = self._applied_stops[row]
         model_index = self._find_model_index(original_position)
         if model_index >= 0:
             self.gradient_model.set_position_at_index(model_index, new_position)
-            # Delay update to avoid recursion
-            from PyQt5.QtCore import QTimer
-            QTimer.singleShot(50, self.update_from_model)
+            self._pos_to_index = None
+            
+            # Track the moved stop until the delayed refresh re-sorts rows;
+            # restarting the timer folds a burst of edits into one refresh
+            self._applied_stops[row] = (new_position, color)
+            self._pending_update_timer.start(50)
             self.stops_changed.emit()
     
-    def _on_delete_stop(self, position):
+    def _on_delete_stop(self, row):
         """Handle stop deletion."""
         if len(self.color_stops) <= 1:
             QMessageBox.information(self, "Cannot Delete", 
                 "Cannot delete the last color stop.")
             return
         
-        model_index = self._find_model_index(position)
+        model_index = self._find_model_index(self._applied_stops[row][0])
         if model_index >= 0:
             self.gradient_model.remove_color_stop_at_index(model_index)
+            self._pos_to_index = None
             self.update_from_model()
             self.stops_changed.emit()
     
-    def _find_model_index(self, target_position, tolerance=0.0001):
+    def _find_model_index(self, target_position):
         """Find model index for a position."""
-        model_stops = self.gradient_model.get_color_stops()
+        if self._pos_to_index is None:
+            self._rebuild_index_cache(self.gradient_model.get_color_stops())
+        return self._pos_to_index.get(round(target_position, 4), -1)
+    
+    def _rebuild_index_cache(self, model_stops):
+        """Map rounded stop positions to model indices (first match wins)."""
+        self._pos_to_index = {}
         for i, (position, _) in enumerate(model_stops):
-            if abs(position - target_position) < tolerance:
-                return i
-        return -1
+            self._pos_to_index.setdefault(round(position, 4), i)
     
     def _apply_new_stops(self, positions, colors):
         """Apply new stops to the model."""
-        self.gradient_model._color_stops = []
-        for pos, color in zip(positions, colors):
-            self.gradient_model.add_color_stop(pos, color)
+        self.gradient_model.set_color_stops(list(zip(positions, colors)))
+        self._pos_to_index = None
         
         self.update_from_model()
         self.stops_changed.emit()
+        self.stops_replaced.emit()
     
     def _update_ui_state(self):
         """Update UI element states."""
@@ -432,38 +553,12 @@ class ColorStopsEditor(QWidget):
     
     def regenerate_with_same_seed(self):
         """Regenerate using the same seed (useful for tweaking other parameters)."""
-        if self._internal_seed is not None:
-            # Temporarily store current values
-            scheme_id = self.scheme_button_group.checkedId()
-            num_stops = self.random_stops_slider.value()
-            
-            # Use the stored seed
-            old_seed = self._internal_seed
-            try:
-                scheme_flags = [
-                    {"harmonious": False}, {"harmonious": True}, {"monochromatic": True},
-                    {"analogous": True}, {"complementary": True}, {"triadic": True}
-                ]
-                flags = scheme_flags[scheme_id] if 0 <= scheme_id < len(scheme_flags) else {}
-                
-                new_gradient = RandomGradientGenerator.generate_random_gradient(
-                    num_stops=num_stops, random_seed=old_seed, **flags
-                )
-                
-                if new_gradient:
-                    self.gradient_model._color_stops = []
-                    for stop in new_gradient.get_color_stop_objects():
-                        self.gradient_model.add_color_stop(stop.position, stop.color)
-                    
-                    self.gradient_model.set_name(new_gradient.get_name())
-                    self.gradient_model.set_description(new_gradient.get_description())
-                    
-                    self.update_from_model()
-                    self.stops_changed.emit()
-                    
-                    self.status_label.setText("Regenerated with same pattern")
-                    
-            except Exception as e:
-                self.status_label.setText(f"Regeneration failed: {str(e)}")
-        else:
+        if self._internal_seed is None:
             self.status_label.setText("No previous pattern to regenerate")
+            return
+        
+        if self._generation_thread is not None and self._generation_thread.isRunning():
+            return
+        
+        # Same worker thread and completion path as a fresh generation
+        self._start_generation(self._internal_seed, regenerate=True)
@@ -7,8 +7,10 @@ while maintaining all features and functionality.
 
 Tab order: Colors, Adjustments, Themes, Blend, Distribution, Seamless, Export
 """
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QGroupBox, QLabel)
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTabWidget, QGridLayout, QLabel)
+from PyQt5.QtCore import QTimer, Qt, QMetaObject, pyqtSignal, pyqtSlot
+import sys
+import importlib.util
 
 # Import core control widgets
 from .color_stops import ColorStopsEditor
@@ -35,27 +37,51 @@ except ImportError:
         ColorDistributionWidget = None
         UNIFIED_DISTRIBUTION_AVAILABLE = False
 
-# Import blending functionality with fallback
-try:
-    from ..gradient_blending.blending_integration import add_blending_tab
-    BLENDING_AVAILABLE = True
-except ImportError:
-    try:
-        from .gradient_blending.blending_integration import add_blending_tab
-        BLENDING_AVAILABLE = True
-    except ImportError:
-        BLENDING_AVAILABLE = False
+# Blending and theme generators are only probed here; their widgets are
+# imported when the tabs are loaded
+BLENDING_AVAILABLE = importlib.util.find_spec('..gradient_blending', __package__) is not None
+THEMES_AVAILABLE = importlib.util.find_spec('..theme_generators', __package__) is not None
 
-# Import theme generators with fallback
-try:
-    from ..theme_generators.theme_generator_integration import integrate_theme_generator
-    THEMES_AVAILABLE = True
-except ImportError:
-    try:
-        from .theme_generators.theme_generator_integration import integrate_theme_generator
-        THEMES_AVAILABLE = True
-    except ImportError:
-        THEMES_AVAILABLE = False
+# Optional feature flags are fixed once the module is imported
+_FEATURES = {
+    'themes': THEMES_AVAILABLE,
+    'blending': BLENDING_AVAILABLE,
+    'unified_distribution': UNIFIED_DISTRIBUTION_AVAILABLE,
+    'math_distribution': ColorStopDistributionWidget is not None,
+    'color_distribution': ColorDistributionWidget is not None
+}
+
+
+def _cached_import(modname, attr):
+    """Return attr from a module, skipping the import machinery once it is loaded."""
+    module = sys.modules.get(importlib.util.resolve_name(modname, __package__))
+    if module is None:
+        module = importlib.import_module(modname, __package__)
+    return getattr(module, attr)
+
+
+class _IndexedTabWidget(QTabWidget):
+    """QTabWidget that caches tab name -> index, rebuilt after tabs are added or removed."""
+    
+    def __init__(self):
+        super().__init__()
+        self._index_by_name = None
+    
+    def tabInserted(self, index):
+        self._index_by_name = None
+        super().tabInserted(index)
+    
+    def tabRemoved(self, index):
+        self._index_by_name = None
+        super().tabRemoved(index)
+    
+    def index_of_name(self, tab_name):
+        """Return the index of the first tab named tab_name, or None."""
+        if self._index_by_name is None:
+            self._index_by_name = {}
+            for i in range(self.count()):
+                self._index_by_name.setdefault(self.tabText(i), i)
+        return self._index_by_name.get(tab_name)
 
 
 class ControlPanel(QWidget):
@@ -63,11 +89,59 @@ class ControlPanel(QWidget):
     
     gradient_updated = pyqtSignal()
     
+    # Placeholder label stylesheets, shared so Qt sees the same QSS each time
+    _STYLE_LOADING = ("color: #4CAF50; font-style: italic; padding: 8px; "
+                      "background-color: #1E3A1E; border-radius: 4px; margin: 5px;")
+    _STYLE_UNAVAILABLE = ("color: #888; font-style: italic; padding: 8px; "
+                          "background-color: #333; border-radius: 4px; margin: 5px;")
+    _STYLE_ERROR = ("color: #ff6666; font-style: italic; padding: 8px; "
+                    "background-color: #442222; border-radius: 4px; margin: 5px;")
+    _STYLES = {
+        "loading": _STYLE_LOADING,
+        "unavailable": _STYLE_UNAVAILABLE,
+        "error": _STYLE_ERROR
+    }
+    
     def __init__(self, gradient_model):
         super().__init__()
         
         self.gradient_model = gradient_model
         self.current_tab_index = 0
+        self._tab_factories = {}  # Placeholder widget -> factory for lazy tabs
+        
+        # Optional widget methods, bound when their widgets are created
+        self._theme_update_fn = None
+        self._adj_get_values = None
+        self._adj_set_values = None
+        
+        # Shutdown plan, filled in as timers and widgets are created
+        self._owned_timers = []
+        self._cleanup_callbacks = []
+        
+        # Merge bursts of child change signals into one gradient_updated per frame
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self.gradient_updated)
+        self._owned_timers.append(self._emit_timer)
+        
+        self._tab_handlers = {}  # Tab page widget -> refresh method
+        
+        # Themes and Blend pages may be replaced by their integrations, so
+        # they are matched by tab name instead
+        self._named_tab_handlers = {
+            "Themes": self._refresh_themes_tab,
+            "Blend": self._refresh_blend_tab
+        }
+        
+        # Widget refreshes requested by model changes, run together on the
+        # next event loop pass
+        self._pending_updates = set()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_updates)
+        self._owned_timers.append(self._update_timer)
         
         self._init_ui()
         self._init_optional_tabs()
@@ -76,15 +150,21 @@ class ControlPanel(QWidget):
         if UNIFIED_DISTRIBUTION_AVAILABLE:
             self._auto_integrate_distribution()
         
-        # Setup enhanced update chain after short delay
-        QTimer.singleShot(1000, self._setup_enhanced_update_chain)
+        # Animated preview chain is connected once the window is shown
+        self._enhanced_chain_ready = False
+    
+    def showEvent(self, event):
+        """Connect the animated preview chain after the window is shown."""
+        super().showEvent(event)
+        if not self._enhanced_chain_ready:
+            QMetaObject.invokeMethod(self, "_setup_enhanced_update_chain", Qt.QueuedConnection)
     
     def _init_ui(self):
         """Initialize the core UI components."""
         layout = QVBoxLayout(self)
         
         # Create tabs
-        self.tabs = QTabWidget()
+        self.tabs = _IndexedTabWidget()
         self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Core tabs in specified order
@@ -98,13 +178,13 @@ class ControlPanel(QWidget):
         
         # 1. Colors tab
         self.color_stops_editor = ColorStopsEditor(self.gradient_model)
-        self.color_stops_editor.stops_changed.connect(self.gradient_updated.emit)
+        self._register_cleanup(self.color_stops_editor)
+        self.color_stops_editor.stops_changed.connect(self._emit_timer.start, Qt.DirectConnection)
+        self._tab_handlers[self.color_stops_editor] = self.color_stops_editor.update_from_model
         self.tabs.addTab(self.color_stops_editor, "Colors")
         
-        # 2. Adjustments tab
-        self.adjustments_widget = GradientAdjustmentsWidget(self.gradient_model)
-        self.adjustments_widget.adjustments_changed.connect(self.gradient_updated.emit)
-        self.tabs.addTab(self.adjustments_widget, "Adjustments")
+        # 2. Adjustments tab (created on first selection)
+        self._add_lazy_tab("Adjustments", self._create_adjustments_tab)
         
         # 3. Themes tab (placeholder - populated by theme integration)
         self.themes_widget = self._create_placeholder("Themes", THEMES_AVAILABLE)
@@ -116,23 +196,76 @@ class ControlPanel(QWidget):
         
         # 5. Distribution tab - unified system
         self.distribution_widget = self._create_distribution_tab()
+        self._tab_handlers[self.distribution_widget] = self._update_distribution_widgets
         self.tabs.addTab(self.distribution_widget, "Distribution")
         
-        # 6. Seamless tab
-        self.seamless_widget = SeamlessBlendingWidget(self.gradient_model)
-        self.seamless_widget.settings_changed.connect(self.gradient_updated.emit)
-        self.tabs.addTab(self.seamless_widget, "Seamless")
+        # 6. Seamless tab (created on first selection)
+        self._add_lazy_tab("Seamless", self._create_seamless_tab)
+        
+        # 7. Export tab (created on first selection)
+        self._add_lazy_tab("Export", self._create_export_tab)
+    
+    def _register_cleanup(self, widget):
+        """Remember widget's cleanup method, if any, for cleanup()."""
+        callback = getattr(widget, 'cleanup', None)
+        if callback is not None:
+            self._cleanup_callbacks.append(callback)
+    
+    def _add_lazy_tab(self, tab_name, factory):
+        """Add an empty tab whose real widget is built by factory on first selection."""
+        placeholder = QWidget()
+        self._tab_factories[placeholder] = factory
+        self.tabs.addTab(placeholder, tab_name)
+    
+    def _materialize_tab(self, index):
+        """Replace a lazy tab's placeholder with its real widget and return it."""
+        placeholder = self.tabs.widget(index)
+        factory = self._tab_factories.pop(placeholder, None)
+        if factory is None:
+            return placeholder
+        
+        tab_name = self.tabs.tabText(index)
+        widget = factory()
         
-        # 7. Export tab
+        # Swap without re-entering _on_tab_changed for the shifting indices
+        current_index = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, tab_name)
+        self.tabs.setCurrentIndex(current_index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        return widget
+    
+    def _create_adjustments_tab(self):
+        """Create the Adjustments tab widget."""
+        self.adjustments_widget = GradientAdjustmentsWidget(self.gradient_model)
+        self._register_cleanup(self.adjustments_widget)
+        self.adjustments_widget.adjustments_changed.connect(self._emit_timer.start, Qt.DirectConnection)
+        self._adj_get_values = getattr(self.adjustments_widget, 'get_adjustment_values', None)
+        self._adj_set_values = getattr(self.adjustments_widget, 'set_adjustment_values', None)
+        self._tab_handlers[self.adjustments_widget] = self._refresh_adjustments_tab
+        return self.adjustments_widget
+    
+    def _create_seamless_tab(self):
+        """Create the Seamless tab widget."""
+        self.seamless_widget = SeamlessBlendingWidget(self.gradient_model)
+        self._register_cleanup(self.seamless_widget)
+        self.seamless_widget.settings_changed.connect(self._emit_timer.start, Qt.DirectConnection)
+        self._tab_handlers[self.seamless_widget] = self._update_seamless_widget
+        return self.seamless_widget
+    
+    def _create_export_tab(self):
+        """Create the Export tab widget."""
         self.export_options = ExportOptionsWidget(self.gradient_model)
-        self.export_options.options_changed.connect(self.gradient_updated.emit)
-        self.tabs.addTab(self.export_options, "Export")
+        self._register_cleanup(self.export_options)
+        self.export_options.options_changed.connect(self._emit_timer.start, Qt.DirectConnection)
+        self._tab_handlers[self.export_options] = self._refresh_export_tab
+        return self.export_options
     
     def _create_placeholder(self, tab_name, is_available):
-        """Create placeholder widget for optional tabs."""
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        
+        """Create placeholder label used directly as an optional tab's page."""
         if is_available:
             info_text = f"{tab_name} functionality is loading..."
             style_class = "loading"
@@ -142,76 +275,75 @@ class ControlPanel(QWidget):
         
         info_label = QLabel(info_text)
         info_label.setWordWrap(True)
+        info_label.setAlignment(Qt.AlignTop)
         info_label.setStyleSheet(self._get_placeholder_style(style_class))
-        layout.addWidget(info_label)
-        layout.addStretch()
+        info_label._is_placeholder = True
         
-        return container
+        return info_label
     
     def _get_placeholder_style(self, style_class):
         """Get stylesheet for placeholder labels."""
-        if style_class == "loading":
-            return ("color: #4CAF50; font-style: italic; padding: 8px; "
-                   "background-color: #1E3A1E; border-radius: 4px; margin: 5px;")
-        else:
-            return ("color: #888; font-style: italic; padding: 8px; "
-                   "background-color: #333; border-radius: 4px; margin: 5px;")
+        return self._STYLES.get(style_class, self._STYLE_UNAVAILABLE)
     
     def _create_distribution_tab(self):
         """Create the unified distribution tab."""
         container = QWidget()
-        layout = QVBoxLayout(container)
         
         if UNIFIED_DISTRIBUTION_AVAILABLE:
+            widget = None
             try:
-                self.unified_distribution_widget = UnifiedDistributionWidget(self.gradient_model)
-                self._connect_distribution_signals(self.unified_distribution_widget)
-                layout.addWidget(self.unified_distribution_widget)
-                return container
+                widget = UnifiedDistributionWidget(self.gradient_model)
+                self._connect_distribution_signals(widget)
             except Exception:
-                pass  # Fall back to individual widgets
+                # Don't leave a half-built widget tree behind the fallback
+                if widget is not None:
+                    widget.deleteLater()
+                    widget = None
+            
+            if widget is not None:
+                self.unified_distribution_widget = widget
+                self._register_cleanup(widget)
+                layout = QVBoxLayout(container)
+                layout.addWidget(widget)
+                return container
         
-        # Create individual distribution widgets
-        self._create_individual_distribution_widgets(layout)
+        # Create individual distribution widgets in a single-column grid
+        self._create_individual_distribution_widgets(QGridLayout(container))
         return container
     
     def _connect_distribution_signals(self, unified_widget):
         """Connect signals from unified distribution widget."""
         if hasattr(unified_widget, 'math_widget'):
-            unified_widget.math_widget.distribution_changed.connect(self.gradient_updated.emit)
+            unified_widget.math_widget.distribution_changed.connect(self._emit_timer.start, Qt.DirectConnection)
         
         if hasattr(unified_widget, 'color_widget'):
-            unified_widget.color_widget.distribution_changed.connect(self.gradient_updated.emit)
+            unified_widget.color_widget.distribution_changed.connect(self._emit_timer.start, Qt.DirectConnection)
     
     def _create_individual_distribution_widgets(self, layout):
         """Create individual distribution widgets when unified widget is not available."""
-        # Mathematical Patterns Group
+        # Mathematical Patterns section
         if ColorStopDistributionWidget:
             try:
-                math_group = QGroupBox("Mathematical Patterns")
-                math_layout = QVBoxLayout(math_group)
-                
                 self.math_distribution_widget = ColorStopDistributionWidget(self.gradient_model)
-                self.math_distribution_widget.distribution_changed.connect(self.gradient_updated.emit)
-                math_layout.addWidget(self.math_distribution_widget)
+                self._register_cleanup(self.math_distribution_widget)
+                self.math_distribution_widget.distribution_changed.connect(self._emit_timer.start, Qt.DirectConnection)
                 
-                layout.addWidget(math_group)
+                layout.addWidget(QLabel("<b>Mathematical Patterns</b>"))
+                layout.addWidget(self.math_distribution_widget)
             except Exception:
                 self._add_error_label(layout, "Mathematical patterns unavailable")
         else:
             self._add_info_label(layout, "Mathematical pattern distribution not available")
         
-        # Color-Based Reordering Group
+        # Color-Based Reordering section
         if ColorDistributionWidget:
             try:
-                color_group = QGroupBox("Color-Based Reordering")
-                color_layout = QVBoxLayout(color_group)
-                
                 self.color_distribution_widget = ColorDistributionWidget(self.gradient_model)
-                self.color_distribution_widget.distribution_changed.connect(self.gradient_updated.emit)
-                color_layout.addWidget(self.color_distribution_widget)
+                self._register_cleanup(self.color_distribution_widget)
+                self.color_distribution_widget.distribution_changed.connect(self._emit_timer.start, Qt.DirectConnection)
                 
-                layout.addWidget(color_group)
+                layout.addWidget(QLabel("<b>Color-Based Reordering</b>"))
+                layout.addWidget(self.color_distribution_widget)
             except Exception:
                 self._add_error_label(layout, "Color distribution unavailable")
         else:
@@ -225,13 +357,15 @@ class ControlPanel(QWidget):
             )
             self._add_info_label(layout, info_text, rich_text=True)
         
-        layout.addStretch()
+        # Let an empty last row take the spare height
+        layout.setRowStretch(layout.rowCount(), 1)
     
     def _add_info_label(self, layout, text, rich_text=False):
         """Add an informational label to a layout."""
         label = QLabel(text)
         label.setWordWrap(True)
-        label.setStyleSheet(self._get_placeholder_style("unavailable"))
+        label.setAlignment(Qt.AlignTop)
+        label.setStyleSheet(self._STYLE_UNAVAILABLE)
         if rich_text:
             label.setTextFormat(Qt.RichText)
         layout.addWidget(label)
@@ -240,10 +374,8 @@ class ControlPanel(QWidget):
         """Add an error label to a layout."""
         label = QLabel(text)
         label.setWordWrap(True)
-        label.setStyleSheet(
-            "color: #ff6666; font-style: italic; padding: 8px; "
-            "background-color: #442222; border-radius: 4px; margin: 5px;"
-        )
+        label.setAlignment(Qt.AlignTop)
+        label.setStyleSheet(self._STYLE_ERROR)
         layout.addWidget(label)
     
     def _init_optional_tabs(self):
@@ -268,33 +400,42 @@ class ControlPanel(QWidget):
         if themes_tab_index is None:
             return
         
-        current_index = self.tabs.currentIndex()
-        
-        # Remove placeholder
-        old_widget = self.tabs.widget(themes_tab_index)
-        self.tabs.removeTab(themes_tab_index)
-        if old_widget:
-            old_widget.deleteLater()
-        
-        # Create theme generator widget
-        from ..theme_generators.theme_generator_widget import ThemeGeneratorWidget
+        # Create theme generator widget; the placeholder stays if this fails
+        ThemeGeneratorWidget = _cached_import('..theme_generators.theme_generator_widget',
+                                              'ThemeGeneratorWidget')
         
         theme_container = QWidget()
         theme_layout = QVBoxLayout(theme_container)
         theme_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.theme_generator_widget = ThemeGeneratorWidget(theme_container)
-        theme_layout.addWidget(self.theme_generator_widget)
+        theme_widget = ThemeGeneratorWidget(theme_container)
+        theme_layout.addWidget(theme_widget)
         
         # Connect signals
-        self.theme_generator_widget.gradient_generated.connect(self._on_theme_gradient_generated)
+        theme_widget.gradient_generated.connect(self._on_theme_gradient_generated)
         
-        # Insert at the correct position
+        self.theme_generator_widget = theme_widget
+        self._register_cleanup(theme_widget)
+        
+        # Theme generators are registered by the widget on construction
+        generators = getattr(theme_widget, 'theme_generators', None)
+        self._theme_generator_class_map = None if generators is None else {
+            name: generator.__class__.__name__ for name, generator in generators.items()
+        }
+        self._theme_update_fn = (getattr(theme_widget, 'update_from_model', None)
+                                 or getattr(theme_widget, 'update_preview', None))
+        
+        # Swap the placeholder for the loaded tab at the same position
+        current_index = self.tabs.currentIndex()
+        old_widget = self.tabs.widget(themes_tab_index)
+        self.tabs.removeTab(themes_tab_index)
+        if old_widget:
+            old_widget.deleteLater()
         self.tabs.insertTab(themes_tab_index, theme_container, "Themes")
         self.tabs.setCurrentIndex(current_index)
         
         # Ensure proper initialization
-        QTimer.singleShot(300, self._ensure_theme_initialization)
+        self._schedule_update('theme_init')
     
     def _load_blending_functionality(self):
         """Load blending functionality and replace placeholder."""
@@ -302,38 +443,36 @@ class ControlPanel(QWidget):
         if blend_tab_index is None:
             return
         
-        current_index = self.tabs.currentIndex()
-        
-        # Remove placeholder
-        old_widget = self.tabs.widget(blend_tab_index)
-        self.tabs.removeTab(blend_tab_index)
-        old_widget.deleteLater()
-        
-        # Create blending widget
-        from ..gradient_blending.gradient_blending_ui import GradientBlendingWidget
+        # Create blending widget; the placeholder stays if this fails
+        GradientBlendingWidget = _cached_import('..gradient_blending.gradient_blending_ui',
+                                                'GradientBlendingWidget')
         
         blend_container = QWidget()
         blend_layout = QVBoxLayout(blend_container)
         blend_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.blending_widget = GradientBlendingWidget(self.gradient_model)
-        blend_layout.addWidget(self.blending_widget)
+        blending_widget = GradientBlendingWidget(self.gradient_model)
+        blend_layout.addWidget(blending_widget)
         
         # Connect signals
-        self.blending_widget.gradient_blended.connect(self._on_gradient_blended)
-        if hasattr(self.blending_widget, 'gradients_added'):
-            self.blending_widget.gradients_added.connect(self._on_blending_gradients_added)
+        blending_widget.gradient_blended.connect(self._on_gradient_blended)
+        if hasattr(blending_widget, 'gradients_added'):
+            blending_widget.gradients_added.connect(self._on_blending_gradients_added)
         
-        # Insert at the correct position
+        self.blending_widget = blending_widget
+        self._register_cleanup(blending_widget)
+        
+        # Swap the placeholder for the loaded tab at the same position
+        current_index = self.tabs.currentIndex()
+        old_widget = self.tabs.widget(blend_tab_index)
+        self.tabs.removeTab(blend_tab_index)
+        old_widget.deleteLater()
         self.tabs.insertTab(blend_tab_index, blend_container, "Blend")
         self.tabs.setCurrentIndex(current_index)
     
     def _find_tab_index(self, tab_name):
         """Find tab index by name."""
-        for i in range(self.tabs.count()):
-            if self.tabs.tabText(i) == tab_name:
-                return i
-        return None
+        return self.tabs.index_of_name(tab_name)
     
     def _ensure_theme_initialization(self):
         """Ensure theme widget is properly initialized."""
@@ -362,8 +501,7 @@ class ControlPanel(QWidget):
                     self.theme_generator_widget.current_generator = self.theme_generator_widget.theme_generators[first_theme]
                     
                     # Generate initial preview
-                    if hasattr(self.theme_generator_widget, 'update_preview'):
-                        QTimer.singleShot(100, self.theme_generator_widget.update_preview)
+                    self._schedule_update('theme_preview')
             
         except Exception:
             pass  # Silent handling for initialization issues
@@ -379,86 +517,79 @@ class ControlPanel(QWidget):
     def _on_tab_changed(self, index):
         """Handle tab change with proper widget updates."""
         self.current_tab_index = index
-        current_tab_widget = self.tabs.widget(index)
-        tab_text = self.tabs.tabText(index)
+        current_tab_widget = self._materialize_tab(index)
         
         # Update specific widgets when their tabs are selected
-        if current_tab_widget == self.color_stops_editor:
-            self.color_stops_editor.update_from_model()
-        
-        elif current_tab_widget == self.adjustments_widget:
-            if hasattr(self.adjustments_widget, '_update_original_stops'):
-                self.adjustments_widget._update_original_stops()
-        
-        elif current_tab_widget == self.distribution_widget:
-            self._update_distribution_widgets()
-        
-        elif current_tab_widget == self.seamless_widget:
-            self._update_seamless_widget()
-        
-        elif current_tab_widget == self.export_options:
-            self.export_options.update_metadata_from_model()
-            self.export_options.update_gradient_count()
-        
-        elif tab_text == "Themes" and hasattr(self, 'theme_generator_widget'):
+        handler = self._tab_handlers.get(current_tab_widget)
+        if handler is None:
+            handler = self._named_tab_handlers.get(self.tabs.tabText(index))
+        if handler is not None:
+            handler()
+    
+    def _refresh_adjustments_tab(self):
+        """Update adjustments widget when tab is selected."""
+        if hasattr(self.adjustments_widget, '_update_original_stops'):
+            self.adjustments_widget._update_original_stops()
+    
+    def _refresh_export_tab(self):
+        """Update export options when tab is selected."""
+        self.export_options.update_metadata_from_model()
+        self.export_options.update_gradient_count()
+    
+    def _refresh_themes_tab(self):
+        """Update theme widget, if loaded, when tab is selected."""
+        if hasattr(self, 'theme_generator_widget'):
             self._update_theme_widget()
-        
-        elif tab_text == "Blend" and hasattr(self, 'blending_widget'):
-            if hasattr(self.blending_widget, 'update_from_model'):
-                try:
-                    self.blending_widget.update_from_model()
-                except Exception:
-                    pass
+    
+    def _refresh_blend_tab(self):
+        """Update blending widget, if loaded, when tab is selected."""
+        update = getattr(getattr(self, 'blending_widget', None), 'update_from_model', None)
+        if update is not None:
+            update()
     
     def _update_seamless_widget(self):
         """Update seamless widget when tab is selected."""
+        if not hasattr(self, 'seamless_widget'):
+            return
         self.seamless_widget.seamless_check.setChecked(self.gradient_model.get_seamless_blend())
         self.seamless_widget.blend_region_spin.setValue(self.gradient_model.get_blend_region())
         self.seamless_widget.blend_region_spin.setEnabled(self.gradient_model.get_seamless_blend())
     
     def _update_theme_widget(self):
         """Update theme widget when tab is selected."""
-        try:
-            if hasattr(self.theme_generator_widget, 'update_from_model'):
-                QTimer.singleShot(50, self.theme_generator_widget.update_from_model)
-            
-            if hasattr(self.theme_generator_widget, 'update_preview'):
-                QTimer.singleShot(100, self.theme_generator_widget.update_preview)
-        except Exception:
-            pass
+        self._schedule_update('theme')
+        self._schedule_update('theme_preview')
     
-    def _update_distribution_widgets(self):
-        """Update distribution widgets when their tab is selected."""
-        try:
-            # Update unified widget if available
-            if hasattr(self, 'unified_distribution_widget'):
-                if hasattr(self.unified_distribution_widget, 'update_from_model'):
-                    self.unified_distribution_widget.update_from_model()
-                
-                # Update individual components within unified widget
-                if hasattr(self.unified_distribution_widget, 'math_widget'):
-                    if hasattr(self.unified_distribution_widget.math_widget, 'update_from_model'):
-                        self.unified_distribution_widget.math_widget.update_from_model()
-                
-                if hasattr(self.unified_distribution_widget, 'color_widget'):
-                    if hasattr(self.unified_distribution_widget.color_widget, 'update_from_model'):
-                        self.unified_distribution_widget.color_widget.update_from_model()
-            
-            # Update individual widgets if they exist
-            if hasattr(self, 'math_distribution_widget'):
-                try:
-                    self.math_distribution_widget.update_from_model()
-                except Exception:
-                    pass
-            
-            if hasattr(self, 'color_distribution_widget'):
-                try:
-                    self.color_distribution_widget.update_from_model()
-                except Exception:
-                    pass
-                    
-        except Exception:
-            pass  # Silent handling for distribution updates
+    def _update_distribution_widgets(self, force=False):
+        """Update distribution widgets when their tab is selected.
+        
+        Args:
+            force: Refresh even widgets that are not visible
+        """
+        # isVisibleTo so a hidden main window doesn't suppress the refresh
+        container = self.distribution_widget
+        if not force and not container.isVisibleTo(self):
+            return
+        
+        unified = getattr(self, 'unified_distribution_widget', None)
+        if unified is not None:
+            candidates = (
+                unified,
+                getattr(unified, 'math_widget', None),
+                getattr(unified, 'color_widget', None)
+            )
+        else:
+            # Integration swaps in a unified widget and deletes these, so
+            # they are only live while no unified widget exists
+            candidates = (
+                getattr(self, 'math_distribution_widget', None),
+                getattr(self, 'color_distribution_widget', None)
+            )
+        
+        for widget in candidates:
+            update = getattr(widget, 'update_from_model', None)
+            if update is not None and (force or widget.isVisibleTo(container)):
+                update()
     
     def _on_theme_gradient_generated(self, gradient):
         """Handle a gradient generated by the theme generator."""
@@ -466,12 +597,8 @@ class ControlPanel(QWidget):
             # Copy the gradient to the main gradient model
             main_gradient = self.gradient_model
             
-            # Clear existing stops
-            main_gradient._color_stops = []
-            
-            # Copy color stops
-            for stop in gradient.get_color_stop_objects():
-                main_gradient.add_color_stop(stop.position, stop.color)
+            # Replace color stops in one step
+            main_gradient.set_color_stops(gradient.get_color_stops())
             
             # Copy metadata
             main_gradient.set_name(gradient.get_name())
@@ -479,8 +606,8 @@ class ControlPanel(QWidget):
             main_gradient.set_author(gradient.get_author())
             main_gradient.set_ugr_category(gradient.get_ugr_category())
             
-            # Emit signal that gradient has been updated
-            self.gradient_updated.emit()
+            # Signal that gradient has been updated
+            self._request_update()
             
             # Update all control widgets to reflect the new gradient
             self._update_all_widgets_for_theme_gradient()
@@ -490,28 +617,77 @@ class ControlPanel(QWidget):
     
     def _update_all_widgets_for_theme_gradient(self):
         """Update all control widgets when a theme gradient is applied."""
+        # Adjustments hold state derived from the stops, so they are always
+        # reset; the other tabs refresh only if visible, since hidden tabs
+        # are refreshed by _on_tab_changed when selected
+        self._schedule_update('adjustments')
+        
+        if self._is_current_tab(self.color_stops_editor):
+            self._schedule_update('color_stops')
+        if self._is_current_tab(getattr(self, 'seamless_widget', None)):
+            self._schedule_update('seamless')
+        if self._is_current_tab(getattr(self, 'export_options', None)):
+            self._schedule_update('export')
+    
+    def _is_current_tab(self, widget):
+        """Check whether widget is the page of the selected tab."""
+        return widget is not None and widget == self.tabs.currentWidget()
+    
+    def _schedule_update(self, key):
+        """Queue a widget refresh; queued refreshes run together on the next event loop pass."""
+        self._pending_updates.add(key)
+        self._update_timer.start()
+    
+    def _flush_updates(self):
+        """Run all queued widget refreshes in a fixed order with one repaint."""
+        pending, self._pending_updates = self._pending_updates, set()
+        
+        self.setUpdatesEnabled(False)
         try:
-            # Update color stops editor
-            if hasattr(self, 'color_stops_editor'):
-                QTimer.singleShot(100, self.color_stops_editor.update_from_model)
-            
-            # Update adjustments widget - reset to avoid conflicts
-            if hasattr(self, 'adjustments_widget'):
-                if hasattr(self.adjustments_widget, '_update_original_stops'):
-                    QTimer.singleShot(150, self.adjustments_widget._update_original_stops)
-                if hasattr(self.adjustments_widget, 'reset_adjustment_values'):
-                    QTimer.singleShot(200, self.adjustments_widget.reset_adjustment_values)
-            
-            # Update seamless widget
-            if hasattr(self, 'seamless_widget'):
-                QTimer.singleShot(250, self._update_seamless_widget)
-            
-            # Update export options
-            if hasattr(self, 'export_options'):
-                QTimer.singleShot(300, self.export_options.update_metadata_from_model)
-            
-        except Exception:
-            pass  # Silent handling for widget updates
+            # Each refresh is guarded on its own so one failure doesn't skip the rest
+            for key, refresh in self._update_steps():
+                if key in pending:
+                    try:
+                        refresh()
+                    except Exception as e:
+                        print(f"Error refreshing {key} widgets: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_steps(self):
+        """Return (key, refresh) pairs in the order queued refreshes run."""
+        return (
+            ('color_stops', self.color_stops_editor.update_from_model),
+            ('adjustments', self._reset_adjustments_widget),
+            ('seamless', self._update_seamless_widget),
+            ('export', self._refresh_export_metadata),
+            ('theme_init', self._ensure_theme_initialization),
+            ('theme', self._refresh_theme_widget),
+            ('theme_preview', self._refresh_theme_preview),
+        )
+    
+    def _reset_adjustments_widget(self):
+        """Reset adjustments to avoid conflicts with the new stops."""
+        if hasattr(self, 'adjustments_widget'):
+            if hasattr(self.adjustments_widget, '_update_original_stops'):
+                self.adjustments_widget._update_original_stops()
+            if hasattr(self.adjustments_widget, 'reset_adjustment_values'):
+                self.adjustments_widget.reset_adjustment_values()
+    
+    def _refresh_export_metadata(self):
+        """Refresh export metadata fields from the model."""
+        if hasattr(self, 'export_options'):
+            self.export_options.update_metadata_from_model()
+    
+    def _refresh_theme_widget(self):
+        """Refresh the theme generator from the model."""
+        if hasattr(self, 'theme_generator_widget') and hasattr(self.theme_generator_widget, 'update_from_model'):
+            self.theme_generator_widget.update_from_model()
+    
+    def _refresh_theme_preview(self):
+        """Regenerate the theme generator preview."""
+        if hasattr(self, 'theme_generator_widget') and hasattr(self.theme_generator_widget, 'update_preview'):
+            self.theme_generator_widget.update_preview()
     
     def _on_blending_gradients_added(self):
         """Handle when gradients are added to the blending widget."""
@@ -520,42 +696,51 @@ class ControlPanel(QWidget):
     
     def _on_gradient_blended(self, blended_gradient):
         """Handle a blended gradient from the blend tab."""
-        # Clear existing stops
-        self.gradient_model._color_stops = []
-        
-        # Copy color stops
-        for stop in blended_gradient.get_color_stop_objects():
-            self.gradient_model.add_color_stop(stop.position, stop.color)
+        # Replace color stops in one step
+        self.gradient_model.set_color_stops(blended_gradient.get_color_stops())
         
         # Copy metadata
         self.gradient_model.set_name(blended_gradient.get_name())
         
         # Update UI elements
-        self.export_options.update_metadata_from_model()
+        if hasattr(self, 'export_options'):
+            self.export_options.update_metadata_from_model()
         
-        # Emit change signal
-        self.gradient_updated.emit()
+        # Signal the change
+        self._request_update()
+    
+    def _request_update(self):
+        """Request a gradient_updated emission; requests within one frame are merged."""
+        self._emit_timer.start()
     
     def reset_controls(self):
         """Reset all controls to match the current gradient model."""
+        # Views on hidden tabs are skipped; _on_tab_changed refreshes them
+        # when they are selected
+        
         # Update color stops
-        self.color_stops_editor.update_from_model()
+        if self._is_current_tab(self.color_stops_editor):
+            self.color_stops_editor.update_from_model()
         
         # Update adjustments
-        if hasattr(self.adjustments_widget, '_update_original_stops'):
-            self.adjustments_widget._update_original_stops()
-        if hasattr(self.adjustments_widget, 'reset_adjustments'):
-            self.adjustments_widget.reset_adjustments()
+        if hasattr(self, 'adjustments_widget'):
+            if hasattr(self.adjustments_widget, '_update_original_stops'):
+                self.adjustments_widget._update_original_stops()
+            if hasattr(self.adjustments_widget, 'reset_adjustments'):
+                self.adjustments_widget.reset_adjustments()
         
         # Update distribution widgets
-        self._update_distribution_widgets()
+        if self._is_current_tab(self.distribution_widget):
+            self._update_distribution_widgets()
         
         # Update seamless settings
-        self._update_seamless_widget()
+        if self._is_current_tab(getattr(self, 'seamless_widget', None)):
+            self._update_seamless_widget()
         
         # Update export options
-        self.export_options.update_metadata_from_model()
-        self.export_options.update_gradient_count()
+        if self._is_current_tab(getattr(self, 'export_options', None)):
+            self.export_options.update_metadata_from_model()
+            self.export_options.update_gradient_count()
         
         # Update themes if available
         if hasattr(self, 'theme_generator_widget'):
@@ -577,94 +762,51 @@ class ControlPanel(QWidget):
             except Exception:
                 pass
     
+    @pyqtSlot()
     def _setup_enhanced_update_chain(self):
-        """Set up enhanced update chain for animated preview integration."""
+        """Set up enhanced update chain for animated preview integration.
+        
+        Retried on the next showEvent if the preview is not available yet.
+        """
+        if self._enhanced_chain_ready:
+            return
+        
+        # Find the main window and animated preview
+        main_window = self.window()
+        if not hasattr(main_window, 'animated_preview'):
+            return
+        
+        self._animated_preview = main_window.animated_preview
+        
+        # Validation runs once after a burst of bulk stop changes
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self._validate_preview_stops)
+        self._owned_timers.append(self._validate_timer)
+        
+        # Distribute/randomize/generate replace all stops; push those to the
+        # preview immediately instead of waiting for gradient_updated
+        self.color_stops_editor.stops_replaced.connect(
+            self._on_stops_replaced, Qt.DirectConnection)
+        
+        self._enhanced_chain_ready = True
+    
+    def _on_stops_replaced(self):
+        """Force an immediate animated preview update after bulk stop changes."""
         try:
-            # Find the main window and animated preview
-            main_window = self.window()
-            if not hasattr(main_window, 'animated_preview'):
-                return False
-            
-            animated_preview = main_window.animated_preview
-            
-            # Connect distribution operations to force immediate updates
-            if hasattr(self, 'color_stops_editor'):
-                editor = self.color_stops_editor
-                
-                # Override distribute evenly to include preview updates
-                if hasattr(editor, 'distribute_evenly_button'):
-                    # Store original handler
-                    original_distribute = editor.distribute_evenly
-                    
-                    def enhanced_distribute_evenly():
-                        """Enhanced distribute evenly with immediate preview update."""
-                        try:
-                            # Call original distribution
-                            original_distribute()
-                            
-                            # Force animated preview update
-                            animated_preview.force_update_from_model(
-                                skip_animation=True,
-                                reason="Enhanced distribute evenly"
-                            )
-                            
-                            # Validate consistency
-                            QTimer.singleShot(100, lambda: 
-                                animated_preview.validate_stop_consistency(verbose=False)
-                            )
-                            
-                        except Exception:
-                            pass  # Silent handling
-                    
-                    # Replace the method
-                    editor.distribute_evenly = enhanced_distribute_evenly
-            
-            # Also connect other randomization buttons
-            self._connect_randomization_buttons(animated_preview)
-            
-            return True
-            
+            self._animated_preview.force_update_from_model(
+                skip_animation=True,
+                reason="Color stops replaced"
+            )
         except Exception:
-            return False
-
-    def _connect_randomization_buttons(self, animated_preview):
-        """Connect randomization buttons to force preview updates."""
+            pass  # Silent handling
+        self._validate_timer.start()
+    
+    def _validate_preview_stops(self):
+        """Check the animated preview still matches the model's stops."""
         try:
-            if hasattr(self, 'color_stops_editor'):
-                editor = self.color_stops_editor
-                
-                # List of methods that need enhanced updates
-                methods_to_enhance = [
-                    'randomize_positions',
-                    'randomize_colors', 
-                    'generate_random_gradient'
-                ]
-                
-                for method_name in methods_to_enhance:
-                    if hasattr(editor, method_name):
-                        original_method = getattr(editor, method_name)
-                        
-                        def create_enhanced_method(orig_method, name):
-                            def enhanced_method(*args, **kwargs):
-                                try:
-                                    # Call original method
-                                    result = orig_method(*args, **kwargs)
-                                    
-                                    # Force preview update
-                                    animated_preview.force_update_from_model(
-                                        skip_animation=True,
-                                        reason=f"Enhanced {name}"
-                                    )
-                                    
-                                    return result
-                                except Exception:
-                                    return None
-                            return enhanced_method
-                        
-                        # Replace the method
-                        enhanced = create_enhanced_method(original_method, method_name)
-                        setattr(editor, method_name, enhanced)
-                        
+            self._animated_preview.validate_stop_consistency(verbose=False)
         except Exception:
             pass  # Silent handling
     
@@ -693,11 +835,8 @@ class ControlPanel(QWidget):
     
     def force_distribution_update(self):
         """Force an update of all distribution widgets."""
-        try:
-            self._update_distribution_widgets()
-            return True
-        except Exception:
-            return False
+        self._update_distribution_widgets(force=True)
+        return True
     
     def get_active_distribution_widget(self):
         """Get the currently active distribution widget."""
@@ -728,9 +867,9 @@ class ControlPanel(QWidget):
             if hasattr(self, 'theme_generator_widget'):
                 widget = self.theme_generator_widget
                 
-                if hasattr(widget, 'theme_generators'):
-                    status['theme_count'] = len(widget.theme_generators)
-                    status['available_themes'] = list(widget.theme_generators.keys())
+                themes = self._theme_generator_class_map or {}
+                status['theme_count'] = len(themes)
+                status['available_themes'] = list(themes)
                 
                 if hasattr(widget, 'current_theme'):
                     status['current_theme'] = widget.current_theme
@@ -745,19 +884,13 @@ class ControlPanel(QWidget):
     
     def force_theme_update(self):
         """Force an update of the theme widget."""
+        update = self._theme_update_fn
+        if update is None:
+            return False
+        
         try:
-            if hasattr(self, 'theme_generator_widget'):
-                widget = self.theme_generator_widget
-                
-                if hasattr(widget, 'update_from_model'):
-                    widget.update_from_model()
-                elif hasattr(widget, 'update_preview'):
-                    widget.update_preview()
-                
-                return True
-            else:
-                return False
-                
+            update()
+            return True
         except Exception:
             return False
     
@@ -772,17 +905,15 @@ class ControlPanel(QWidget):
         
         if hasattr(self, 'theme_generator_widget'):
             widget = self.theme_generator_widget
+            themes = self._theme_generator_class_map
             debug_info['widget_details'] = {
                 'class_name': widget.__class__.__name__,
-                'has_theme_generators': hasattr(widget, 'theme_generators'),
+                'has_theme_generators': themes is not None,
                 'ui_initialized': getattr(widget, '_ui_initialized', False)
             }
             
-            if hasattr(widget, 'theme_generators'):
-                debug_info['widget_details']['themes'] = {
-                    name: generator.__class__.__name__ 
-                    for name, generator in widget.theme_generators.items()
-                }
+            if themes is not None:
+                debug_info['widget_details']['themes'] = dict(themes)
         
         return debug_info
     
@@ -808,40 +939,45 @@ class ControlPanel(QWidget):
     
     def is_tab_available(self, tab_name):
         """Check if a specific tab is available and functional."""
-        widget = self.get_tab_widget(tab_name)
-        if not widget:
-            return False
-        
-        # Check if it's a placeholder
-        if isinstance(widget, QWidget) and widget.layout():
-            layout = widget.layout()
-            if layout.count() == 2:  # Placeholder has label + stretch
-                first_item = layout.itemAt(0)
-                if first_item and isinstance(first_item.widget(), QLabel):
-                    return False
-        
-        return True
+        return self._is_page_available(self.get_tab_widget(tab_name))
+    
+    def is_tab_available_by_index(self, index):
+        """Check if the tab at index is available and functional."""
+        return self._is_page_available(self.tabs.widget(index))
+    
+    def _is_page_available(self, widget):
+        """Check whether a tab page is functional rather than a placeholder."""
+        # Lazy tabs are not marked, so they count as available before they are built
+        return bool(widget) and not getattr(widget, '_is_placeholder', False)
     
     def get_available_tabs(self):
         """Get list of available and functional tabs."""
-        available_tabs = []
-        for i in range(self.tabs.count()):
-            tab_name = self.tabs.tabText(i)
-            if self.is_tab_available(tab_name):
-                available_tabs.append(tab_name)
-        return available_tabs
+        return [self.tabs.tabText(i) for i in range(self.tabs.count())
+                if self.is_tab_available_by_index(i)]
     
     def refresh_all_widgets(self):
-        """Refresh all widgets to match current gradient model."""
-        current_tab = self.tabs.currentIndex()
+        """Refresh tab widgets to match current gradient model.
+        
+        Only the visible tab is refreshed now; every other tab is refreshed
+        by _on_tab_changed when selected, and lazy tabs are built from the
+        model at that point.
+        """
+        index = self.tabs.currentIndex()
+        widget = self.tabs.widget(index)
+        if widget is None or widget in self._tab_factories:
+            return
         
-        # Force update all tabs
-        for i in range(self.tabs.count()):
-            self.tabs.setCurrentIndex(i)
-            self._on_tab_changed(i)
+        handler = self._tab_handlers.get(widget)
+        if handler is None:
+            handler = self._named_tab_handlers.get(self.tabs.tabText(index))
+        if handler is None:
+            return
         
-        # Return to original tab
-        self.tabs.setCurrentIndex(current_tab)
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            handler()
+        finally:
+            self.tabs.setUpdatesEnabled(True)
     
     def get_widget_status(self):
         """Get comprehensive status of all widgets."""
@@ -851,13 +987,7 @@ class ControlPanel(QWidget):
             'distribution_capabilities': self.get_distribution_capabilities(),
             'theme_status': self.get_theme_status(),
             'total_tabs': self.tabs.count(),
-            'features': {
-                'themes': THEMES_AVAILABLE,
-                'blending': BLENDING_AVAILABLE,
-                'unified_distribution': UNIFIED_DISTRIBUTION_AVAILABLE,
-                'math_distribution': ColorStopDistributionWidget is not None,
-                'color_distribution': ColorDistributionWidget is not None
-            }
+            'features': dict(_FEATURES)
         }
     
     def export_settings(self):
@@ -874,19 +1004,16 @@ class ControlPanel(QWidget):
         }
         
         # Export adjustment settings if available
-        if hasattr(self.adjustments_widget, 'get_adjustment_values'):
+        if self._adj_get_values is not None:
             try:
-                settings['adjustments'] = self.adjustments_widget.get_adjustment_values()
+                settings['adjustments'] = self._adj_get_values()
             except Exception:
                 pass
         
         # Export theme settings if available
-        if hasattr(self, 'theme_generator_widget'):
-            try:
-                if hasattr(self.theme_generator_widget, 'current_theme'):
-                    settings['current_theme'] = self.theme_generator_widget.current_theme
-            except Exception:
-                pass
+        current_theme = getattr(getattr(self, 'theme_generator_widget', None), 'current_theme', None)
+        if current_theme is not None:
+            settings['current_theme'] = current_theme
         
         return settings
     
@@ -900,25 +1027,33 @@ class ControlPanel(QWidget):
             if 'gradient_metadata' in settings:
                 metadata = settings['gradient_metadata']
                 for key, value in metadata.items():
-                    if hasattr(self.gradient_model, f'set_{key}'):
+                    setter = getattr(self.gradient_model, f'set_{key}', None)
+                    if setter is not None:
                         try:
-                            getattr(self.gradient_model, f'set_{key}')(value)
+                            setter(value)
                         except Exception:
                             pass
             
-            # Import adjustment settings
-            if 'adjustments' in settings and hasattr(self.adjustments_widget, 'set_adjustment_values'):
-                try:
-                    self.adjustments_widget.set_adjustment_values(settings['adjustments'])
-                except Exception:
-                    pass
+            # Import adjustment settings, building the lazy tab if needed
+            if 'adjustments' in settings:
+                if self._adj_set_values is None:
+                    adjustments_index = self._find_tab_index("Adjustments")
+                    if adjustments_index is not None:
+                        self._materialize_tab(adjustments_index)
+                if self._adj_set_values is not None:
+                    try:
+                        self._adj_set_values(settings['adjustments'])
+                    except Exception:
+                        pass
             
-            # Switch to specified tab
+            # Switch to specified tab; selecting a different tab refreshes it
+            previous_index = self.tabs.currentIndex()
             if 'current_tab' in settings:
                 self.switch_to_tab(settings['current_tab'])
             
-            # Refresh all widgets
-            self.refresh_all_widgets()
+            # Refresh all widgets unless the tab switch already did
+            if self.tabs.currentIndex() == previous_index:
+                self.refresh_all_widgets()
             
             return True
             
@@ -927,28 +1062,11 @@ class ControlPanel(QWidget):
     
     def cleanup(self):
         """Clean up resources and stop any running timers."""
-        try:
-            # Stop any timers
-            for child in self.findChildren(QTimer):
-                if child.isActive():
-                    child.stop()
-            
-            # Cleanup individual widgets
-            widgets_to_cleanup = [
-                'color_stops_editor', 'adjustments_widget', 'seamless_widget',
-                'export_options', 'theme_generator_widget', 'blending_widget',
-                'unified_distribution_widget', 'math_distribution_widget',
-                'color_distribution_widget'
-            ]
-            
-            for widget_name in widgets_to_cleanup:
-                if hasattr(self, widget_name):
-                    widget = getattr(self, widget_name)
-                    if hasattr(widget, 'cleanup'):
-                        try:
-                            widget.cleanup()
-                        except Exception:
-                            pass
-            
-        except Exception:
-            pass  # Silent cleanup
\ No newline at end of file
+        for timer in self._owned_timers:
+            timer.stop()
+        
+        for callback in self._cleanup_callbacks:
+            try:
+                callback()
+            except Exception:
+                pass  # Silent cleanup
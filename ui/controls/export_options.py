@@ -11,7 +11,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                            QFormLayout, QCheckBox, QFileDialog, QMessageBox,
                            QInputDialog, QLineEdit, QTabWidget, QSpinBox, 
                            QProgressBar, QTextEdit, QDialog, QDialogButtonBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
 
 from ...export.image_exporter import ImageExporter
 from ...export.file_formats import (
@@ -20,11 +20,20 @@ from ...export.file_formats import (
     create_gradient_export_summary
 )
 
+# Qt's own file dialog opens quickly where the native one can take seconds
+# to enumerate shell extensions and sidebar places
+_FD_OPTS = QFileDialog.DontUseNativeDialog | QFileDialog.DontUseCustomDirectoryIcons
+_DIR_OPTS = _FD_OPTS | QFileDialog.ShowDirsOnly
+
+# Cap on failed filenames listed in the export summary
+MAX_LISTED_FAILURES = 1000
+
 
 class BatchExportThread(QThread):
     """Thread for batch export operations."""
     
     export_completed = pyqtSignal(dict)
+    progress = pyqtSignal(int, int, str)  # done, total, file name
     
     def __init__(self, export_function, *args):
         super().__init__()
@@ -34,7 +43,8 @@ class BatchExportThread(QThread):
     def run(self):
         """Run the export operation."""
         try:
-            success_count, total_count, failed_files = self.export_function(*self.args)
+            success_count, total_count, failed_files = self.export_function(
+                *self.args, progress_callback=self.progress.emit)
             summary = create_gradient_export_summary(success_count, total_count, failed_files)
             self.export_completed.emit(summary)
         except Exception as e:
@@ -50,6 +60,8 @@ class BatchMapExportDialog(QDialog):
         super().__init__(parent)
         self.gradient_count = gradient_count
         self.output_directory = ""
+        self._preview_key = None  # (base_name, padding) the template was built for
+        self._preview_template = ""
         self.init_ui()
     
     def init_ui(self):
@@ -117,12 +129,18 @@ class BatchMapExportDialog(QDialog):
         self._update_preview()
         sequential_layout.addRow("Preview:", self.preview_label)
         
-        # Connect signals for live preview
+        # Connect signals for live preview, merging keystroke bursts into
+        # one refresh
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(30)
+        self._preview_timer.timeout.connect(self._update_preview)
+        
         for widget in [self.base_name_edit, self.start_number_spin, self.padding_spin]:
             if hasattr(widget, 'textChanged'):
-                widget.textChanged.connect(self._update_preview)
+                widget.textChanged.connect(self._preview_timer.start)
             else:
-                widget.valueChanged.connect(self._update_preview)
+                widget.valueChanged.connect(self._preview_timer.start)
         
         layout.addWidget(self.sequential_group)
         
@@ -149,7 +167,7 @@ class BatchMapExportDialog(QDialog):
         """Browse for output directory."""
         directory = QFileDialog.getExistingDirectory(
             self, "Select Output Directory", 
-            self.output_directory or os.path.expanduser("~")
+            self.output_directory or os.path.expanduser("~"), options=_DIR_OPTS
         )
         
         if directory:
@@ -163,8 +181,14 @@ class BatchMapExportDialog(QDialog):
         start_num = self.start_number_spin.value()
         padding = self.padding_spin.value()
         
-        examples = [f"{base_name}_{start_num + i:0{padding}d}.map" 
-                   for i in range(min(3, self.gradient_count))]
+        # Rebuild the filename template only when its inputs change
+        key = (base_name, padding)
+        if key != self._preview_key:
+            self._preview_key = key
+            self._preview_template = base_name.replace("{", "{{").replace("}", "}}") + f"_{{:0{padding}d}}.map"
+        
+        template = self._preview_template
+        examples = [template.format(start_num + i) for i in range(min(3, self.gradient_count))]
         if self.gradient_count > 3:
             examples.append("...")
         
@@ -206,8 +230,13 @@ Success rate: {summary['success_rate']:.1f}%"""
         # Failed files (if any)
         if summary.get('failed_files'):
             layout.addWidget(QLabel("Failed files:"))
+            failed_files = summary['failed_files']
+            lines = failed_files[:MAX_LISTED_FAILURES]
+            if len(failed_files) > MAX_LISTED_FAILURES:
+                lines = lines + [f"... and {len(failed_files) - MAX_LISTED_FAILURES} more"]
             failed_text = QTextEdit()
-            failed_text.setPlainText('\n'.join(summary['failed_files']))
+            failed_text.setUndoRedoEnabled(False)
+            failed_text.setPlainText('\n'.join(lines))
             failed_text.setMaximumHeight(100)
             failed_text.setReadOnly(True)
             layout.addWidget(failed_text)
@@ -245,6 +274,14 @@ class ExportOptionsWidget(QWidget):
         self.export_size = 512
         self.gradient_type = "linear"
         self.draw_points = False
+        self.quiet_success = True  # Report successful exports in the status label only
+        self._export_running = False  # A batch export thread is in progress
+        
+        # Restores the idle status text after a quiet success message
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.setInterval(2000)
+        self._status_reset_timer.timeout.connect(lambda: self.status_label.setText("Ready to export"))
         
         self.init_ui()
     
@@ -253,18 +290,43 @@ class ExportOptionsWidget(QWidget):
         main_layout = QVBoxLayout(self)
         
         self.tabs = QTabWidget()
+        self._tab_builders = {}  # Placeholder widget -> builder for lazy tabs
         
         # Single Export Tab
         self.tabs.addTab(self._create_single_export_tab(), "Single Export")
         
-        # Batch Export Tab
-        self.tabs.addTab(self._create_batch_export_tab(), "Batch Export")
-        
-        # Metadata Tab
-        self.tabs.addTab(self._create_metadata_tab(), "Metadata & JWildfire")
+        # Batch Export and Metadata Tabs (built on first selection)
+        self._add_lazy_tab("Batch Export", self._create_batch_export_tab)
+        self._add_lazy_tab("Metadata & JWildfire", self._create_metadata_tab)
         
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         main_layout.addWidget(self.tabs)
     
+    def _add_lazy_tab(self, title, builder):
+        """Add an empty tab whose real widget is built on first selection."""
+        placeholder = QWidget()
+        self._tab_builders[placeholder] = builder
+        self.tabs.addTab(placeholder, title)
+    
+    def _ensure_tab_built(self, index):
+        """Replace a lazy tab's placeholder with its real widget."""
+        placeholder = self.tabs.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is None:
+            return
+        
+        title = self.tabs.tabText(index)
+        widget = builder()
+        
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self.update_gradient_count()
+    
     def _create_single_export_tab(self):
         """Create the single export tab."""
         widget = QWidget()
@@ -366,6 +428,10 @@ Perfect for creating gradient series for JWildfire and other applications."""
         self.gradient_count_label.setStyleSheet("color: #888; font-style: italic;")
         batch_layout.addWidget(self.gradient_count_label)
         
+        self.batch_progress_bar = QProgressBar()
+        self.batch_progress_bar.setVisible(False)
+        batch_layout.addWidget(self.batch_progress_bar)
+        
         layout.addWidget(batch_group)
         
         # Features info
@@ -508,7 +574,7 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
     def _export_ugr(self):
         """Export gradient as UGR file."""
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save UGR File", "", "UGR Files (*.ugr)"
+            self, "Save UGR File", "", "UGR Files (*.ugr)", options=_FD_OPTS
         )
         
         if file_path:
@@ -526,7 +592,8 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
     def _export_image(self):
         """Export gradient as image file."""
         filter_str = "PNG Images (*.png)" if self.export_format == "png" else "JPEG Images (*.jpg)"
-        file_path, _ = QFileDialog.getSaveFileName(self, "Export Image", "", filter_str)
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Image", "", filter_str,
+                                                   options=_FD_OPTS)
         
         if file_path:
             def export_func():
@@ -541,7 +608,8 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
     
     def _export_file(self, filter_str, save_function, format_name):
         """Generic file export method."""
-        file_path, _ = QFileDialog.getSaveFileName(self, f"Save {format_name} File", "", filter_str)
+        file_path, _ = QFileDialog.getSaveFileName(self, f"Save {format_name} File", "", filter_str,
+                                                   options=_FD_OPTS)
         if file_path:
             self._execute_export(lambda: save_function(self.gradient_model, file_path), 
                                file_path, format_name)
@@ -550,8 +618,8 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
         """Execute export with error handling."""
         try:
             if export_func():
-                self.status_label.setText(f"Exported: {os.path.basename(file_path)}")
-                QMessageBox.information(self, "Success", f"Gradient exported as {format_name} successfully!")
+                self._report_success(f"Exported: {os.path.basename(file_path)}",
+                                     f"Gradient exported as {format_name} successfully!")
             else:
                 self.status_label.setText("Export failed")
                 QMessageBox.warning(self, "Export Failed", f"Failed to export gradient as {format_name}.")
@@ -559,6 +627,14 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
             self.status_label.setText("Export error")
             QMessageBox.critical(self, "Error", f"Error exporting {format_name}: {str(e)}")
     
+    def _report_success(self, status_text, message):
+        """Show a success in the status label, or as a popup when quiet_success is off."""
+        self.status_label.setText(status_text)
+        if self.quiet_success:
+            self._status_reset_timer.start()
+        else:
+            QMessageBox.information(self, "Success", message)
+    
     def _on_export_multiple_clicked(self):
         """Handle export multiple gradients button click."""
         main_window = self.window()
@@ -573,14 +649,14 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
             return
             
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Multiple Gradients", "", "UGR Files (*.ugr)"
+            self, "Export Multiple Gradients", "", "UGR Files (*.ugr)", options=_FD_OPTS
         )
         
         if file_path:
             try:
                 export_multiple_gradients_ugr(gradients, file_path)
-                self.status_label.setText(f"Exported {len(gradients)} gradients")
-                QMessageBox.information(self, "Success", f"Exported {len(gradients)} gradients to {file_path}")
+                self._report_success(f"Exported {len(gradients)} gradients",
+                                     f"Exported {len(gradients)} gradients to {file_path}")
             except Exception as e:
                 self.status_label.setText("Export failed")
                 QMessageBox.critical(self, "Error", f"Failed to export gradients: {str(e)}")
@@ -604,7 +680,7 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
             return
         
         output_directory = QFileDialog.getExistingDirectory(
-            self, "Select Output Directory for Custom Named MAP Files"
+            self, "Select Output Directory for Custom Named MAP Files", options=_DIR_OPTS
         )
         
         if output_directory:
@@ -637,22 +713,44 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
                 args = (gradients, settings['output_directory'])
             
             self.export_thread = BatchExportThread(export_function, *args)
+            self.export_thread.progress.connect(self._on_batch_export_progress, Qt.QueuedConnection)
             self.export_thread.export_completed.connect(self._on_batch_export_completed)
+            
+            self.batch_progress_bar.setRange(0, len(gradients))
+            self.batch_progress_bar.setValue(0)
+            self.batch_progress_bar.setVisible(True)
+            self._export_running = True
+            self.batch_export_list_button.setEnabled(False)
+            self.batch_export_custom_button.setEnabled(False)
+            
             self.export_thread.start()
             
             self.status_label.setText("Batch export in progress...")
             
         except Exception as e:
+            self._export_running = False
+            self.update_gradient_count()
             QMessageBox.critical(self, "Export Error", f"Failed to start batch export: {str(e)}")
     
+    def _on_batch_export_progress(self, done, total, file_name):
+        """Update the batch progress bar after each exported file."""
+        self.batch_progress_bar.setValue(done)
+        self.status_label.setText(f"Exporting {done}/{total}: {file_name}")
+    
     def _on_batch_export_completed(self, summary):
         """Handle batch export completion."""
+        self.batch_progress_bar.setVisible(False)
+        self._export_running = False
+        self.update_gradient_count()
         self.status_label.setText("Batch export completed")
         ExportSummaryDialog(summary, self).exec_()
     
     # Public interface methods
     def update_metadata_from_model(self):
         """Update all metadata UI elements from the gradient model."""
+        if not hasattr(self, 'name_edit'):
+            return  # Metadata tab not built yet; it reads the model when built
+        
         self.name_edit.setText(self.gradient_model.get_name())
         self.author_edit.setText(self.gradient_model.get_author())
         self.description_edit.setText(self.gradient_model.get_description())
@@ -661,14 +759,18 @@ Enable <b>Combine Multiple Gradients</b> to use this gradient as part of a combi
     
     def update_gradient_count(self):
         """Update the gradient count display."""
+        if not hasattr(self, 'gradient_count_label'):
+            return  # Batch tab not built yet
+        
         main_window = self.window()
         if hasattr(main_window, 'gradient_list_panel'):
             count = len(main_window.gradient_list_panel.gradients)
             self.gradient_count_label.setText(f"{count} gradients in list")
             
-            has_gradients = count > 0
-            self.batch_export_list_button.setEnabled(has_gradients)
-            self.batch_export_custom_button.setEnabled(has_gradients)
+            # Batches never overlap: the buttons stay off until the running one completes
+            can_export = count > 0 and not self._export_running
+            self.batch_export_list_button.setEnabled(can_export)
+            self.batch_export_custom_button.setEnabled(can_export)
         else:
             self.gradient_count_label.setText("Gradient list not available")
     
@@ -170,12 +170,8 @@ def on_gradient_blended(control_panel, gradient):
         # Copy the gradient to the main gradient model
         main_gradient = control_panel.gradient_model
         
-        # Clear existing stops
-        main_gradient._color_stops = []
-        
-        # Copy color stops
-        for stop in gradient.get_color_stop_objects():
-            main_gradient.add_color_stop(stop.position, stop.color)
+        # Replace color stops in one step
+        main_gradient.set_color_stops(gradient.get_color_stops())
         
         # Copy metadata
         main_gradient.set_name(gradient.get_name())
@@ -37,6 +37,11 @@ try:
 except ImportError:
     UNDO_REDO_AVAILABLE = False
 
+try:
+    from .animation.undo_redo_integration import register_main_window
+except ImportError:
+    register_main_window = None
+
 try:
     from ..export.image_exporter import ImageExporter
     from ..export.file_formats import save_map_format, save_ugr_format
@@ -71,6 +76,9 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
+        if register_main_window is not None:
+            register_main_window(self)
+        
         # Core state
         self.settings = QSettings("GradientGenerator", "JWildfire")
         self.current_gradient = Gradient()
@@ -556,9 +564,7 @@ class MainWindow(QMainWindow):
     
     def _copy_gradient_data(self, source, target):
         """Copy gradient data between instances."""
-        target._color_stops = []
-        for stop in source.get_color_stop_objects():
-            target.add_color_stop(stop.position, stop.color)
+        target.set_color_stops(source.get_color_stops())
         
         # Copy metadata
         metadata_attrs = ['name', 'author', 'description', 'ugr_category', 'combine_gradients', 
@@ -643,6 +649,13 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         
+        # Stop control timers and wait for background work before teardown
+        if hasattr(self, 'control_panel'):
+            try:
+                self.control_panel.cleanup()
+            except:
+                pass
+        
         event.accept()
     
     def keyPressEvent(self, event):
@@ -14,6 +14,7 @@ FIXED: Removed all sorting to maintain true randomization
 import random
 import math
 import colorsys
+import numpy as np
 from typing import List, Tuple, Optional
 
 # Import with fallback mechanism
@@ -31,6 +32,81 @@ except ImportError:
         from gradient_generator.core.color_utils import rgb_to_hsv, hsv_to_rgb
 
 
+# Numba is optional; the HSV kernel is compiled on first use when available
+_HSV_JIT_AVAILABLE = None
+_hsv_to_rgb_jit = None
+
+
+def _hsv_to_rgb_kernel(hues, sats, vals, out):
+    """
+    Convert HSV arrays to RGB, matching color_utils.hsv_to_rgb per stop.
+    
+    Args:
+        hues: float64 array of hues in degrees (0-360)
+        sats: float64 array of saturations (0-1)
+        vals: float64 array of values (0-1)
+        out: Preallocated uint8 array of shape (N, 3) receiving the colors
+    """
+    for k in range(hues.shape[0]):
+        s = sats[k]
+        v = vals[k]
+        if s == 0:
+            r = g = b = v
+        else:
+            h_segment = hues[k] / 60
+            i = math.floor(h_segment)
+            f = h_segment - i
+            
+            p = v * (1 - s)
+            q = v * (1 - s * f)
+            t = v * (1 - s * (1 - f))
+            
+            if i == 0:
+                r, g, b = v, t, p
+            elif i == 1:
+                r, g, b = q, v, p
+            elif i == 2:
+                r, g, b = p, v, t
+            elif i == 3:
+                r, g, b = p, q, v
+            elif i == 4:
+                r, g, b = t, p, v
+            else:
+                r, g, b = v, p, q
+        
+        out[k, 0] = int(max(0.0, min(255.0, r * 255)))
+        out[k, 1] = int(max(0.0, min(255.0, g * 255)))
+        out[k, 2] = int(max(0.0, min(255.0, b * 255)))
+
+
+def _get_hsv_to_rgb_kernel():
+    """Return the compiled HSV kernel, or None when Numba is unavailable."""
+    global _HSV_JIT_AVAILABLE, _hsv_to_rgb_jit
+    
+    if _HSV_JIT_AVAILABLE is None:
+        try:
+            import numba
+        except ImportError:
+            _HSV_JIT_AVAILABLE = False
+        else:
+            _hsv_to_rgb_jit = numba.njit(cache=True)(_hsv_to_rgb_kernel)
+            _HSV_JIT_AVAILABLE = True
+    
+    return _hsv_to_rgb_jit
+
+
+def _hsv_batch_to_rgb(hues, sats, vals):
+    """Convert parallel HSV lists to a list of (r, g, b) tuples."""
+    kernel = _get_hsv_to_rgb_kernel()
+    if kernel is None:
+        return [hsv_to_rgb(h, s, v) for h, s, v in zip(hues, sats, vals)]
+    
+    out = np.empty((len(hues), 3), dtype=np.uint8)
+    kernel(np.asarray(hues, dtype=np.float64), np.asarray(sats, dtype=np.float64),
+           np.asarray(vals, dtype=np.float64), out)
+    return [tuple(row) for row in out.tolist()]
+
+
 class RandomGradientGenerator:
     """Simplified class for generating random gradients with truly random positions and colors."""
     
@@ -109,7 +185,7 @@ class RandomGradientGenerator:
     @staticmethod
     def _generate_random_colors(scheme, base_hue, num_stops, rand_gen):
         """Generate truly random colors based on the specified scheme."""
-        colors = []
+        hues, sats, vals = [], [], []
         
         if scheme == "random":
             # Completely random colors across full spectrum
@@ -117,8 +193,9 @@ class RandomGradientGenerator:
                 hue = rand_gen.uniform(0, 360)
                 saturation = rand_gen.uniform(0.3, 1.0)
                 value = rand_gen.uniform(0.2, 1.0)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
                 
         elif scheme == "monochromatic":
             # Random variations of a single hue
@@ -128,8 +205,9 @@ class RandomGradientGenerator:
                 # Random saturation and value for variety
                 saturation = rand_gen.uniform(0.3, 0.9)
                 value = rand_gen.uniform(0.2, 0.9)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
                 
         elif scheme == "analogous":
             # Random colors within 60° range around base hue
@@ -138,8 +216,9 @@ class RandomGradientGenerator:
                 hue = (base_hue + rand_gen.uniform(-30, 30)) % 360
                 saturation = rand_gen.uniform(0.5, 0.9)
                 value = rand_gen.uniform(0.3, 0.9)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
                 
         elif scheme == "complementary":
             # Random colors from base hue and its complement
@@ -155,8 +234,9 @@ class RandomGradientGenerator:
                 
                 saturation = rand_gen.uniform(0.6, 1.0)
                 value = rand_gen.uniform(0.3, 0.9)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
                 
         elif scheme == "triadic":
             # Random colors from three hues 120° apart
@@ -173,8 +253,9 @@ class RandomGradientGenerator:
                 hue = (chosen_hue + rand_gen.uniform(-15, 15)) % 360
                 saturation = rand_gen.uniform(0.5, 0.9)
                 value = rand_gen.uniform(0.3, 0.9)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
                 
         elif scheme == "harmonious":
             # Random colors within a harmonious range (similar to analogous but wider)
@@ -183,11 +264,12 @@ class RandomGradientGenerator:
                 hue = (base_hue + rand_gen.uniform(-45, 45)) % 360
                 saturation = rand_gen.uniform(0.5, 0.95)
                 value = rand_gen.uniform(0.3, 0.9)
-                color = hsv_to_rgb(hue, saturation, value)
-                colors.append(color)
+                hues.append(hue)
+                sats.append(saturation)
+                vals.append(value)
         
-        # DO NOT shuffle the colors - maintain generation order for true randomness
-        return colors
+        # Convert in one batch; DO NOT shuffle - maintain generation order for true randomness
+        return _hsv_batch_to_rgb(hues, sats, vals)
     
     @staticmethod
     def _generate_random_positions(num_stops, rand_gen):
@@ -199,18 +281,12 @@ class RandomGradientGenerator:
             else:
                 return [0.0, 1.0]  # Start and end
         
-        # Generate completely random positions
-        positions = []
-        
-        # Always include start and end positions
-        positions.append(0.0)
-        positions.append(1.0)
-        
-        # Generate random intermediate positions
-        for i in range(num_stops - 2):
-            # Generate a random position between 0.01 and 0.99 to avoid edge overlap
-            pos = rand_gen.uniform(0.01, 0.99)
-            positions.append(pos)
+        # Generate completely random positions: start and end first, then
+        # intermediate positions between 0.01 and 0.99 to avoid edge overlap
+        positions = [0.0] * num_stops
+        positions[1] = 1.0
+        for i in range(2, num_stops):
+            positions[i] = rand_gen.uniform(0.01, 0.99)
         
         # DO NOT SORT positions - maintain random order for true randomization
         
@@ -189,22 +189,12 @@ def on_theme_gradient_generated(control_panel, gradient):
             print("Error: No gradient model found in control panel")
             return
         
-        # Clear existing stops
-        main_gradient._color_stops = []
-        
-        # Copy color stops with error handling
+        # Replace color stops in one step
         try:
-            for stop in gradient.get_color_stop_objects():
-                main_gradient.add_color_stop(stop.position, stop.color)
+            main_gradient.set_color_stops(gradient.get_color_stops())
         except Exception as e:
             print(f"Error copying color stops: {e}")
-            # Fallback: try to get stops as tuples
-            try:
-                for position, color in gradient.get_color_stops():
-                    main_gradient.add_color_stop(position, color)
-            except Exception as e2:
-                print(f"Error with fallback color stop copying: {e2}")
-                return
+            return
         
         # Copy metadata safely
         try: